@@ -1,14 +1,37 @@
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import mmap
 import os
 import re
+import sys
 from collections import Counter
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 
-console = Console()
+class _LazyConsole:
+    """Create the rich Console on first use."""
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+console = _LazyConsole()
+
+RICH_MARKUP = re.compile(r"\[/?[a-z ]+\]")
+
+def _note(message, plain=False):
+    """Print a status message: rich markup normally, plain text on stderr in --plain/--json mode."""
+    if plain:
+        print(RICH_MARKUP.sub("", message).strip(), file=sys.stderr)
+    else:
+        console.print(message)
 
 def parse_history(file_path, start_date=None, end_date=None):
     """
@@ -52,6 +75,525 @@ def parse_history(file_path, start_date=None, end_date=None):
 
     return commands, full_invocations
 
+# Same rules as parse_history, applied to raw bytes: optional leading whitespace,
+# Zsh metadata, then the command up to the next ';'
+HISTORY_ENTRY = re.compile(rb"^[ \t]*: (\d+):\d+;([^;\n]*)", re.MULTILINE)
+PARALLEL_THRESHOLD = 8 * 1024 * 1024  # Below this size a single process is faster
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters summary that tracks at most `capacity` items.
+
+    Each reported count over-estimates the true count by at most its `error`,
+    and every error is bounded by total / capacity.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        # One (count, item) entry per tracked item; counts may be stale (too low)
+        self._heap = []
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _pop_min(self):
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts[item] == count:
+                return count, item
+            heapq.heappush(self._heap, (self.counts[item], item))
+
+    def min_count(self):
+        if len(self.counts) < self.capacity:
+            return 0
+        count, item = self._pop_min()
+        heapq.heappush(self._heap, (count, item))
+        return count
+
+    def offer(self, item, count=1):
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+        else:
+            # Replace the smallest entry; its count becomes the newcomer's error
+            floor, victim = self._pop_min()
+            del self.counts[victim], self.errors[victim]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+            heapq.heappush(self._heap, (floor + count, item))
+
+    def merge(self, other):
+        """
+        Merge another summary into this one (used to combine parallel chunks).
+        """
+        floor_a, floor_b = self.min_count(), other.min_count()
+        merged = {}
+        for item in self.counts.keys() | other.counts.keys():
+            merged[item] = (
+                self.counts.get(item, floor_a) + other.counts.get(item, floor_b),
+                self.errors.get(item, floor_a) + other.errors.get(item, floor_b),
+            )
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda entry: entry[1][0])
+        self.total += other.total
+        self.counts = {item: count for item, (count, _) in kept}
+        self.errors = {item: error for item, (_, error) in kept}
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+        return self
+
+    def max_error(self):
+        """Upper bound on the over-estimate of any reported count."""
+        return max(self.errors.values(), default=0)
+
+    def most_common(self, n=None):
+        """Return [(item, count, error), ...] sorted by estimated count."""
+        top = sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)[:n]
+        return [(item, count, self.errors[item]) for item, count in top]
+
+def _count_chunk(file_path, start, end, start_ts=None, end_ts=None, capacity=None):
+    """
+    Count base commands and full invocations in the byte range [start, end).
+    With `capacity`, full invocations go into a bounded SpaceSaving summary.
+    """
+    commands = Counter()
+    full_invocations = SpaceSaving(capacity) if capacity else Counter()
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in HISTORY_ENTRY.finditer(data, start, end):
+            if start_ts is not None:
+                # Compare raw epoch seconds instead of building a datetime per line
+                timestamp = int(match.group(1))
+                if not (start_ts <= timestamp <= end_ts):
+                    continue
+
+            command = match.group(2).decode('utf-8', errors='replace').strip()
+            if capacity:
+                full_invocations.offer(command)
+            else:
+                full_invocations[command] += 1
+            commands[command.split(" ", 1)[0]] += 1
+
+    return commands, full_invocations
+
+def _count_chunk_by_day(file_path, start, end):
+    """
+    Like _count_chunk, but bucket the Counters per local calendar day.
+    """
+    days = {}
+    day_start = day_end = None
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in HISTORY_ENTRY.finditer(data, start, end):
+            timestamp = int(match.group(1))
+            # History is mostly chronological, so the current day's bounds are reused
+            if day_start is None or not (day_start <= timestamp < day_end):
+                midnight = datetime.fromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+                day_start = midnight.timestamp()
+                day_end = (midnight + timedelta(days=1)).timestamp()
+                commands, full_invocations = days.setdefault(midnight.date().isoformat(), (Counter(), Counter()))
+
+            command = match.group(2).decode('utf-8', errors='replace').strip()
+            full_invocations[command] += 1
+            commands[command.split(" ", 1)[0]] += 1
+
+    return days
+
+def _chunk_bounds(file_path, chunks, start=0, end=None):
+    """
+    Split the byte range [start, end) of the file into line-aligned ranges.
+    """
+    size = os.path.getsize(file_path) if end is None else end
+    if size <= start:
+        return []
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = [start]
+        for i in range(1, chunks):
+            newline = data.find(b"\n", max(start + (size - start) * i // chunks, bounds[-1]), size)
+            if newline == -1:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+        bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+
+def parse_history_parallel(file_path, start_date=None, end_date=None, workers=None, capacity=None):
+    """
+    Memory-map the history file, parse line-aligned chunks in worker processes
+    and merge the per-chunk Counters.
+
+    Returns (commands, full_invocations) as Counters. With `capacity`,
+    full_invocations is a SpaceSaving summary holding at most that many entries.
+    """
+    start_ts = end_ts = None
+    if start_date and end_date:
+        start_ts, end_ts = start_date.timestamp(), end_date.timestamp()
+
+    workers = workers or os.cpu_count() or 1
+    if os.path.getsize(file_path) < PARALLEL_THRESHOLD:
+        workers = 1
+    bounds = _chunk_bounds(file_path, workers)
+
+    commands = Counter()
+    full_invocations = Counter()
+    if workers == 1:
+        results = [_count_chunk(file_path, start, end, start_ts, end_ts, capacity) for start, end in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_count_chunk, file_path, start, end, start_ts, end_ts, capacity)
+                       for start, end in bounds]
+            results = [future.result() for future in futures]
+
+    if capacity:
+        full_invocations = SpaceSaving(capacity)
+    for chunk_commands, chunk_invocations in results:
+        commands.update(chunk_commands)
+        if capacity:
+            full_invocations.merge(chunk_invocations)
+        else:
+            full_invocations.update(chunk_invocations)
+
+    return commands, full_invocations
+
+def _history_identity(file_path, offset):
+    """
+    Identify the history file by device/inode plus a hash of its first bytes,
+    so a rewritten or truncated file invalidates the checkpoint.
+    """
+    stat = os.stat(file_path)
+    with open(file_path, 'rb') as file:
+        head = hashlib.sha1(file.read(min(offset, 4096))).hexdigest()
+    return {"dev": stat.st_dev, "ino": stat.st_ino, "head": head}
+
+def _default_cache_file(file_path):
+    key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+    return os.path.join(os.path.expanduser("~/.cache/cli_wrapped"), f"{key}.json")
+
+def load_history_counts(file_path, cache_file=None, workers=None):
+    """
+    Return per-day (commands, full_invocations) Counters for the history file.
+
+    A checkpoint (byte offset, file identity and the per-day counters) is kept
+    in `cache_file`, so later runs only parse bytes appended since the last run.
+    """
+    cache_file = cache_file or _default_cache_file(file_path)
+    size = os.path.getsize(file_path)
+
+    days = {}
+    offset = 0
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        if cache["offset"] <= size and cache["identity"] == _history_identity(file_path, cache["offset"]):
+            offset = cache["offset"]
+            days = {day: (Counter(counts["commands"]), Counter(counts["invocations"]))
+                    for day, counts in cache["days"].items()}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Only consume complete lines; a partially written last line is picked up next run
+    with open(file_path, 'rb') as file:
+        end = size
+        while end > offset:
+            file.seek(max(offset, end - 65536))
+            block = file.read(end - file.tell())
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                end = end - len(block) + newline + 1
+                break
+            end -= len(block)
+
+    if end > offset:
+        workers = workers or os.cpu_count() or 1
+        if end - offset < PARALLEL_THRESHOLD:
+            workers = 1
+        bounds = _chunk_bounds(file_path, workers, offset, end)
+        if workers == 1:
+            results = [_count_chunk_by_day(file_path, start, stop) for start, stop in bounds]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_count_chunk_by_day, file_path, start, stop) for start, stop in bounds]
+                results = [future.result() for future in futures]
+
+        for chunk_days in results:
+            for day, (chunk_commands, chunk_invocations) in chunk_days.items():
+                commands, full_invocations = days.setdefault(day, (Counter(), Counter()))
+                commands.update(chunk_commands)
+                full_invocations.update(chunk_invocations)
+
+        if os.path.dirname(cache_file):
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({
+                "path": os.path.abspath(file_path),
+                "offset": end,
+                "identity": _history_identity(file_path, end),
+                "days": {day: {"commands": commands, "invocations": full_invocations}
+                         for day, (commands, full_invocations) in days.items()},
+            }, f)
+        os.replace(tmp_file, cache_file)
+
+    return days
+
+def counts_for_range(days, start_date=None, end_date=None):
+    """
+    Merge cached per-day Counters for the days between start_date and end_date (inclusive).
+    """
+    commands = Counter()
+    full_invocations = Counter()
+    start = start_date.date().isoformat() if start_date else None
+    end = end_date.date().isoformat() if end_date else None
+    for day, (day_commands, day_invocations) in days.items():
+        if (start and day < start) or (end and day > end):
+            continue
+        commands.update(day_commands)
+        full_invocations.update(day_invocations)
+    return commands, full_invocations
+
+# Weeks start on Monday: bins [Mon, next Mon) labelled with their Monday
+WEEK_FREQ = "W-MON"
+
+def _count_chunk_by_hour(file_path, start, end):
+    """
+    Count base commands per (UTC quarter-hour start, command) in the byte range [start, end).
+    UTC offsets are whole quarter-hours, so each quarter falls in exactly one local hour.
+    """
+    counts = Counter()
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in HISTORY_ENTRY.finditer(data, start, end):
+            hour = int(match.group(1)) // 900 * 900
+            command = match.group(2).decode('utf-8', errors='replace').strip()
+            counts[hour, command.split(" ", 1)[0]] += 1
+    return counts
+
+def _write_table(df, path):
+    """
+    Write a DataFrame as Parquet, falling back to gzipped CSV without pyarrow/fastparquet.
+    """
+    try:
+        df.to_parquet(path + ".parquet", index=False)
+        return path + ".parquet"
+    except ImportError:
+        df.to_csv(path + ".csv.gz", index=False)
+        return path + ".csv.gz"
+
+def _read_table(path):
+    import pandas as pd
+
+    if os.path.exists(path + ".parquet"):
+        return pd.read_parquet(path + ".parquet")
+    return pd.read_csv(path + ".csv.gz", parse_dates=["bucket"])
+
+def export_buckets(file_path, output_dir="cli_buckets", workers=None):
+    """
+    Precompute per-hour, per-day and per-week base command counts and store them
+    as columnar tables (bucket, command, count) in output_dir.
+    """
+    import pandas as pd
+
+    workers = workers or os.cpu_count() or 1
+    if os.path.getsize(file_path) < PARALLEL_THRESHOLD:
+        workers = 1
+    bounds = _chunk_bounds(file_path, workers)
+    if workers == 1:
+        results = [_count_chunk_by_hour(file_path, start, end) for start, end in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_count_chunk_by_hour, file_path, start, end) for start, end in bounds]
+            results = [future.result() for future in futures]
+
+    counts = Counter()
+    for chunk_counts in results:
+        counts.update(chunk_counts)
+
+    quarters = pd.DataFrame(
+        [(quarter, command, count) for (quarter, command), count in counts.items()],
+        columns=["bucket", "command", "count"],
+    )
+    # Local wall-clock hours, matching how the reports filter by date
+    local_hours = {quarter: datetime.fromtimestamp(quarter).replace(minute=0)
+                   for quarter in quarters["bucket"].unique()}
+    quarters["bucket"] = pd.to_datetime(quarters["bucket"].map(local_hours))
+    hourly = quarters.groupby(["bucket", "command"], as_index=False)["count"].sum()
+    hourly["count"] = hourly["count"].astype("int32")
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for name, freq in (("hourly", None), ("daily", "D"), ("weekly", WEEK_FREQ)):
+        table = hourly
+        if freq:
+            grouped = hourly.groupby([pd.Grouper(key="bucket", freq=freq, label="left", closed="left"), "command"])
+            table = grouped["count"].sum().reset_index()
+            table = table[table["count"] > 0]
+        table = table.sort_values(["bucket", "command"]).reset_index(drop=True)
+        table["command"] = table["command"].astype("category")
+        written[name] = _write_table(table, os.path.join(output_dir, name))
+    return written
+
+def query_buckets(output_dir="cli_buckets", start_date=None, end_date=None, granularity="daily", top_n=10):
+    """
+    Answer date-range queries from the precomputed tables without reparsing history.
+
+    The range covers whole days from start_date through end_date, the same as
+    counts_for_range, at every granularity. Weekly buckets at the edges of a
+    range only hold the days inside it (they're rebuilt from the daily table).
+
+    Returns (top_commands, trend) where trend is total commands per bucket.
+    """
+    import pandas as pd
+
+    clip_weeks = granularity == "weekly" and (start_date or end_date)
+    df = _read_table(os.path.join(output_dir, "daily" if clip_weeks else granularity))
+    if start_date:
+        df = df[df["bucket"] >= pd.Timestamp(start_date).normalize()]
+    if end_date:
+        df = df[df["bucket"] < pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)]
+    if clip_weeks:
+        df = df.groupby([pd.Grouper(key="bucket", freq=WEEK_FREQ, label="left", closed="left"), "command"],
+                        observed=True)["count"].sum().reset_index()
+        df = df[df["count"] > 0]
+    totals = df.groupby("command", observed=True)["count"].sum().sort_values(ascending=False)
+    top_commands = [(command, int(count)) for command, count in totals.head(top_n).items()]
+    trend = df.groupby("bucket")["count"].sum()
+    return top_commands, trend
+
+BASH_ENTRY = re.compile(rb"^#(\d+)\r?\n([^\n]*)", re.MULTILINE)
+FISH_ENTRY = re.compile(rb"^- cmd: ([^\n]*)\n(?:[ \t]+(?!when:)[^\n]*\n)*?[ \t]+when: (\d+)", re.MULTILINE)
+
+FISH_ESCAPE = re.compile(rb"\\([\\n])")
+
+def _unescape_fish(match):
+    return b"\n" if match.group(1) == b"n" else b"\\"
+
+def detect_history_format(file_path):
+    """
+    Guess the shell history format: 'zsh' (extended), 'bash' or 'fish'.
+    """
+    name = os.path.basename(file_path)
+    if "fish" in name:
+        return "fish"
+    with open(file_path, 'rb') as file:
+        head = file.read(4096)
+    if HISTORY_ENTRY.search(head):
+        return "zsh"
+    if FISH_ENTRY.search(head) or head.startswith(b"- cmd: "):
+        return "fish"
+    return "bash"
+
+def history_user(file_path):
+    """
+    Derive the owning user from a history path (/home/<user>/... or /root/...).
+    """
+    parts = Path(os.path.abspath(file_path)).parts
+    if "home" in parts and parts.index("home") + 1 < len(parts) - 1:
+        return parts[parts.index("home") + 1]
+    if len(parts) > 1 and parts[1] == "root":
+        return "root"
+    return Path(file_path).parent.name or file_path
+
+def count_history_file(file_path, start_ts=None, end_ts=None):
+    """
+    Count base commands and full invocations in a zsh, bash or fish history file.
+    Bash histories without any timestamps can't be filtered by date, so all of
+    their entries are counted.
+    """
+    commands, full_invocations, _ = _count_history(file_path, start_ts, end_ts)
+    return commands, full_invocations
+
+def _count_history(file_path, start_ts=None, end_ts=None):
+    """
+    count_history_file plus a flag telling whether the file had no timestamps
+    (and was therefore counted without applying the date range).
+    """
+    history_format = detect_history_format(file_path)
+    if history_format == "zsh":
+        return _count_chunk(file_path, 0, os.path.getsize(file_path), start_ts, end_ts) + (False,)
+
+    with open(file_path, 'rb') as file:
+        data = file.read()
+
+    undated = False
+    if history_format == "bash":
+        if BASH_ENTRY.search(data) is None:
+            undated = True
+            start_ts = end_ts = None
+            entries = ((None, line) for line in data.splitlines() if line.strip())
+        else:
+            entries = ((timestamp, line) for timestamp, line in BASH_ENTRY.findall(data))
+    else:
+        entries = ((timestamp, FISH_ESCAPE.sub(_unescape_fish, line))
+                   for line, timestamp in FISH_ENTRY.findall(data))
+
+    commands = Counter()
+    full_invocations = Counter()
+    for timestamp, line in entries:
+        if start_ts is not None and (timestamp is None or not (start_ts <= int(timestamp) <= end_ts)):
+            continue
+        # Same rule as the Zsh parser: the command runs up to the first ';'
+        command = line.decode('utf-8', errors='replace').split(";", 1)[0].strip()
+        full_invocations[command] += 1
+        commands[command.split(" ", 1)[0]] += 1
+
+    return commands, full_invocations, undated
+
+def analyze_fleet(sources, start_date=None, end_date=None, workers=8, top_n=10):
+    """
+    Parse many users' history files concurrently with a bounded process pool
+    and return combined plus per-user top-N results.
+
+    `sources` is a list of paths and/or glob patterns.
+    """
+    paths = sorted({path for source in sources for path in (glob.glob(os.path.expanduser(source)) or [source])
+                    if os.path.isfile(path)})
+    start_ts = end_ts = None
+    if start_date and end_date:
+        start_ts, end_ts = start_date.timestamp(), end_date.timestamp()
+
+    combined_commands = Counter()
+    combined_invocations = Counter()
+    users = {}
+    errors = {}
+    undated = []
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as executor:
+        futures = {executor.submit(_count_history, path, start_ts, end_ts): path for path in paths}
+        for future, path in futures.items():
+            try:
+                commands, full_invocations, no_timestamps = future.result()
+            except Exception as e:
+                errors[path] = str(e)
+                continue
+            if no_timestamps and start_ts is not None:
+                undated.append(path)
+            user = users.setdefault(history_user(path), {"commands": Counter(), "invocations": Counter()})
+            user["commands"].update(commands)
+            user["invocations"].update(full_invocations)
+            combined_commands.update(commands)
+            combined_invocations.update(full_invocations)
+
+    return {
+        "sources": paths,
+        "errors": errors,
+        "undated": undated,
+        "combined": {
+            "total": sum(combined_commands.values()),
+            "top_commands": combined_commands.most_common(top_n),
+            "top_invocations": combined_invocations.most_common(top_n),
+        },
+        "users": {
+            name: {
+                "total": sum(counts["commands"].values()),
+                "top_commands": counts["commands"].most_common(top_n),
+                "top_invocations": counts["invocations"].most_common(top_n),
+            }
+            for name, counts in sorted(users.items())
+        },
+    }
+
 def analyze_commands(commands):
     """
     Analyze base command frequency and sort by usage.
@@ -66,10 +608,26 @@ def analyze_invocations(full_invocations):
     counter = Counter(full_invocations)
     return counter.most_common(10)
 
-def display_table(title, data):
+def display_total(text, plain=False):
+    """
+    Display a headline total in a Rich panel (or a plain line).
+    """
+    if plain:
+        print(text)
+        return
+    from rich.panel import Panel
+    console.print(Panel(f"[bold green]🎉 {text} 🎉[/bold green]", style="bold magenta"))
+
+def display_table(title, data, plain=False):
     """
-    Display a styled table using Rich.
+    Display a styled table using Rich (or numbered plain-text lines).
     """
+    if plain:
+        print(f"\n{title}:")
+        for i, (command, count) in enumerate(data, 1):
+            print(f"{i}. {command} - {count}")
+        return
+    from rich.table import Table
     table = Table(title=f"[bold magenta]{title}[/bold magenta]", header_style="bold cyan")
     table.add_column("Rank", justify="right")
     table.add_column("Command")
@@ -80,40 +638,163 @@ def display_table(title, data):
     
     console.print(table)
 
+def display_fleet(report, output_file="cli_fleet_summary.json", plain=False):
+    """
+    Display combined and per-user results of analyze_fleet and save them as JSON.
+    """
+    combined = report["combined"]
+    display_total(f"{combined['total']} commands from {len(report['users'])} users "
+                  f"({len(report['sources'])} history files)", plain)
+    display_table("Fleet Base Commands", combined["top_commands"], plain)
+    display_table("Fleet Full Command Invocations", combined["top_invocations"], plain)
+
+    per_user = []
+    for name, stats in report["users"].items():
+        top = stats["top_commands"][0] if stats["top_commands"] else ("-", 0)
+        per_user.append((name, str(stats["total"]), f"{top[0]} ({top[1]})"))
+    if plain:
+        print("\nPer User:")
+        for name, total, top in per_user:
+            print(f"{name} - {total} commands, top: {top}")
+    else:
+        from rich.table import Table
+        table = Table(title="[bold magenta]Per User[/bold magenta]", header_style="bold cyan")
+        table.add_column("User")
+        table.add_column("Commands", justify="right")
+        table.add_column("Top Command")
+        for row in per_user:
+            table.add_row(*row)
+        console.print(table)
+
+    for path, error in report["errors"].items():
+        _note(f"[yellow]Warning: Could not process {path} - {error}[/yellow]", plain)
+    for path in report["undated"]:
+        _note(f"[yellow]Note: {path} has no timestamps, all entries counted regardless of date range[/yellow]", plain)
+
+    with open(output_file, "w") as f:
+        json.dump(report, f, indent=2)
+    _note(f"\n[bold green]Fleet summary saved to {output_file}[/bold green]", plain)
+
 def main():
+    parser = argparse.ArgumentParser(description="CLI Wrapped: most used terminal commands.")
+    parser.add_argument("--fleet", nargs="+", metavar="PATH_OR_GLOB",
+                        help="Analyze many history files, e.g. '/home/*/.zsh_history' '/home/*/.bash_history'")
+    parser.add_argument("--start", default="2024-01-01", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end", default="2024-12-31", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=8, help="Maximum parallel parsers in fleet mode")
+    parser.add_argument("--top", type=int, default=10, help="Number of top entries in fleet and bucket query modes")
+    parser.add_argument("--max-invocations", type=int, default=None, metavar="K",
+                        help="Stream with a bounded heavy-hitters summary of K full invocations (approximate)")
+    parser.add_argument("--export-buckets", metavar="DIR",
+                        help="Precompute hourly/daily/weekly command counts into columnar tables in DIR")
+    parser.add_argument("--query-buckets", metavar="DIR",
+                        help="Answer the date range from tables written by --export-buckets")
+    parser.add_argument("--granularity", choices=["hourly", "daily", "weekly"], default="daily",
+                        help="Bucket size used by --query-buckets")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--plain", action="store_true", help="Plain text output (fast start, no rich)")
+    output.add_argument("--json", action="store_true", help="JSON output (fast start, no rich)")
+    args = parser.parse_args()
+    fast = args.plain or args.json
+
     # Default history file (modify if using different shell)
     history_file = os.path.expanduser("~/.zsh_history")
     
     # Date range for the past year
-    start_date = datetime(2024, 1, 1)
-    end_date = datetime(2024, 12, 31)
+    start_date = datetime.strptime(args.start, "%Y-%m-%d")
+    end_date = datetime.strptime(args.end, "%Y-%m-%d")
+
+    if args.fleet:
+        _note(f"[bold yellow]Parsing {len(args.fleet)} history source(s)...[/bold yellow]", fast)
+        report = analyze_fleet(args.fleet, start_date, end_date, args.workers, args.top)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            display_fleet(report, plain=args.plain)
+        return
+    
+    if args.query_buckets:
+        top_commands, trend = query_buckets(args.query_buckets, start_date, end_date, args.granularity, args.top)
+        trend_rows = [(str(bucket), int(count)) for bucket, count in trend.items()]
+        if args.json:
+            print(json.dumps({"total_commands": int(trend.sum()), "top_commands": top_commands,
+                              "trend": trend_rows}, indent=2))
+            return
+        display_total(f"Total Commands Used: {int(trend.sum())}", args.plain)
+        display_table("Base Commands", top_commands, args.plain)
+        display_table(f"Commands per {args.granularity} bucket", trend_rows, args.plain)
+        return
     
     # Check if history file exists
     if not Path(history_file).exists():
-        console.print(f"[bold red]Error:[/bold red] History file '{history_file}' not found!")
+        _note(f"[bold red]Error:[/bold red] History file '{history_file}' not found!", fast)
+        return
+
+    if args.export_buckets:
+        written = export_buckets(history_file, args.export_buckets)
+        if args.json:
+            print(json.dumps(written, indent=2))
+            return
+        for name, path in written.items():
+            _note(f"[bold green]{name} buckets saved to {path}[/bold green]", args.plain)
         return
     
     # Parse history and filter by date range
-    console.print(f"[bold yellow]Parsing history from {history_file}...[/bold yellow]")
-    commands, full_invocations = parse_history(history_file, start_date=start_date, end_date=end_date)
+    _note(f"[bold yellow]Parsing history from {history_file}...[/bold yellow]", fast)
+    if args.max_invocations:
+        # Bounded memory: counts while parsing and keeps at most K invocations.
+        # Same whole-day end bound as counts_for_range: include all of end_date
+        end_of_day = end_date + timedelta(days=1) - timedelta(seconds=1)
+        commands, full_invocations = parse_history_parallel(
+            history_file, start_date=start_date, end_date=end_of_day, capacity=args.max_invocations)
+    else:
+        days = load_history_counts(history_file)
+        commands, full_invocations = counts_for_range(days, start_date=start_date, end_date=end_date)
     
     if not commands:
-        console.print("[bold red]No commands found in the specified date range.[/bold red]")
+        _note("[bold red]No commands found in the specified date range.[/bold red]", fast)
         return
     
     # Analyze total commands used
-    total_commands = len(commands)
-    console.print(Panel(f"[bold green]🎉 Total Commands Used: {total_commands} 🎉[/bold green]", style="bold magenta"))
+    total_commands = sum(commands.values())
+    top_commands = analyze_commands(commands)
+    invocation_errors = None
+    if isinstance(full_invocations, SpaceSaving):
+        top = full_invocations.most_common(10)
+        top_invocations = [(inv, count) for inv, count, _ in top]
+        invocation_errors = {inv: error for inv, _, error in top}
+    else:
+        top_invocations = analyze_invocations(full_invocations)
+
+    if args.json:
+        print(json.dumps({
+            "total_commands": total_commands,
+            "top_commands": top_commands,
+            "top_invocations": [
+                {"invocation": inv, "count": count, "max_error": invocation_errors[inv]}
+                if invocation_errors is not None else {"invocation": inv, "count": count}
+                for inv, count in top_invocations
+            ],
+        }, indent=2))
+        return
+
+    display_total(f"Total Commands Used: {total_commands}", args.plain)
     
     # Analyze base commands
-    top_commands = analyze_commands(commands)
-    console.print("\n[bold underline]Top 10 Base Commands:[/bold underline]")
-    display_table("Base Commands", top_commands)
+    if not args.plain:
+        console.print("\n[bold underline]Top 10 Base Commands:[/bold underline]")
+    display_table("Base Commands", top_commands, args.plain)
     
     # Analyze full invocations
-    top_invocations = analyze_invocations(full_invocations)
-    console.print("\n[bold underline]Top 10 Full Command Invocations:[/bold underline]")
-    display_table("Full Command Invocations", top_invocations)
+    if not args.plain:
+        console.print("\n[bold underline]Top 10 Full Command Invocations:[/bold underline]")
+    if invocation_errors is not None:
+        display_table("Full Command Invocations",
+                      [(inv, f"{count} (≤ +{invocation_errors[inv]})") for inv, count in top_invocations],
+                      args.plain)
+        _note("[dim]Approximate counts: each may be over-estimated by at most the amount shown.[/dim]", args.plain)
+    else:
+        display_table("Full Command Invocations", top_invocations, args.plain)
     
     # Save results to a file
     output_file = "cli_command_summary.txt"
@@ -126,9 +807,12 @@ def main():
         
         f.write("\nTop 10 Full Command Invocations:\n")
         for i, (inv, count) in enumerate(top_invocations, 1):
-            f.write(f"{i}. {inv} - {count} times\n")
+            if invocation_errors is not None:
+                f.write(f"{i}. {inv} - {count} times (approximate, max over-estimate {invocation_errors[inv]})\n")
+            else:
+                f.write(f"{i}. {inv} - {count} times\n")
     
-    console.print(f"\n[bold green]Summary saved to {output_file}[/bold green]")
+    _note(f"\n[bold green]Summary saved to {output_file}[/bold green]", args.plain)
 
 if __name__ == "__main__":
     main()
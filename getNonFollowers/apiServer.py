@@ -0,0 +1,342 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from diffFollower import diff_followers
+from streamExtract import iter_usernames_followers, iter_usernames_following
+
+CHUNK_SIZE = 65536
+EXTRACTORS = {
+    'followers_file': iter_usernames_followers,
+    'following_file': iter_usernames_following,
+}
+STATUS_TEXT = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 411: 'Length Required', 413: 'Payload Too Large',
+               500: 'Internal Server Error'}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _UploadPipe(io.RawIOBase):
+    """
+    Jembatan antara event loop (penerima upload) dan thread extractor.
+    Potongan upload diteruskan lewat antrean terbatas, sehingga file tidak
+    pernah ditampung utuh di memori.
+    """
+
+    def __init__(self, loop, max_pending=8):
+        self._loop = loop
+        self._queue = queue.Queue()
+        self._space = asyncio.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._max_pending = max_pending
+        self._buf = b''
+        self.aborted = False
+        self.finished = False
+
+    async def feed(self, chunk):
+        while self._pending >= self._max_pending and not self.aborted:
+            self._space.clear()
+            await self._space.wait()
+        if self.aborted:
+            return
+        with self._lock:
+            self._pending += 1
+        self._queue.put(chunk)
+
+    def finish(self):
+        if not self.finished:
+            self.finished = True
+            self._queue.put(None)
+
+    def abort(self):
+        # Dipanggil dari thread extractor ketika parsing gagal
+        self.aborted = True
+        self._loop.call_soon_threadsafe(self._space.set)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._buf:
+            chunk = self._queue.get()
+            if chunk is None:
+                self._queue.put(None)
+                return 0
+            with self._lock:
+                self._pending -= 1
+            self._loop.call_soon_threadsafe(self._space.set)
+            self._buf = chunk
+        size = min(len(buffer), len(self._buf))
+        buffer[:size] = self._buf[:size]
+        self._buf = self._buf[size:]
+        return size
+
+
+def _extract(extractor, pipe):
+    try:
+        return list(extractor(io.BufferedReader(pipe, CHUNK_SIZE)))
+    except Exception:
+        pipe.abort()
+        raise
+
+
+async def _read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+class _BodyReader:
+    """Membaca body sebatas Content-Length dalam potongan kecil."""
+
+    def __init__(self, reader, length):
+        self.reader = reader
+        self.remaining = length
+
+    async def read(self):
+        if self.remaining <= 0:
+            return b''
+        data = await self.reader.read(min(CHUNK_SIZE, self.remaining))
+        if not data:
+            raise HttpError(400, "Body request terputus")
+        self.remaining -= len(data)
+        return data
+
+
+async def _parse_multipart(body, boundary, on_part):
+    """
+    Parser multipart/form-data streaming. `on_part(name)` mengembalikan
+    penerima (objek dengan coroutine `feed` dan method `finish`) untuk field
+    tersebut, atau None. `finish` dipanggil begitu delimiter penutup part terlihat.
+    """
+    delimiter = b'\r\n--' + boundary
+    buf = b'\r\n'
+    # Lewati preamble sampai boundary pertama
+    while True:
+        index = buf.find(delimiter)
+        if index != -1:
+            buf = buf[index + len(delimiter):]
+            break
+        data = await body.read()
+        if not data:
+            raise HttpError(400, "Boundary multipart tidak ditemukan")
+        buf = buf[-len(delimiter):] + data
+
+    while True:
+        while len(buf) < 2:
+            data = await body.read()
+            if not data:
+                raise HttpError(400, "Multipart tidak diakhiri boundary")
+            buf += data
+        if buf.startswith(b'--'):
+            return
+        # Header part
+        while b'\r\n\r\n' not in buf:
+            data = await body.read()
+            if not data:
+                raise HttpError(400, "Header multipart tidak lengkap")
+            buf += data
+        raw_headers, buf = buf.split(b'\r\n\r\n', 1)
+        match = re.search(rb'name="([^"]*)"', raw_headers)
+        sink = on_part(match.group(1).decode('utf-8') if match else None)
+
+        # Isi part: teruskan semua kecuali ekor yang mungkin awal delimiter
+        while True:
+            index = buf.find(delimiter)
+            if index != -1:
+                if sink and index:
+                    await sink.feed(buf[:index])
+                if sink:
+                    sink.finish()
+                buf = buf[index + len(delimiter):]
+                break
+            keep = len(delimiter) - 1
+            if sink and len(buf) > keep:
+                await sink.feed(buf[:-keep])
+                buf = buf[-keep:]
+            data = await body.read()
+            if not data:
+                raise HttpError(400, "Multipart tidak diakhiri boundary")
+            buf += data
+
+
+class FollowerApi:
+    """
+    Service HTTP async untuk endpoint /api/check-followers/ yang dipakai index.html.
+    """
+
+    def __init__(self, max_body=512 * 1024 * 1024, workers=None, max_uploads=None):
+        self.max_body = max_body
+        workers = max(2, workers or min(32, (os.cpu_count() or 1) + 4))
+        # Setiap upload butuh dua thread extractor sekaligus; upload lain menunggu
+        # giliran di semaphore supaya extractor yang antre tidak menahan yang berjalan
+        self.max_uploads = max_uploads or workers // 2
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.diff_executor = ThreadPoolExecutor(max_workers=self.max_uploads)
+        self.upload_slots = asyncio.Semaphore(self.max_uploads)
+        self.latencies = deque(maxlen=10000)
+        self.requests = 0
+        self.errors = 0
+
+    async def check_followers(self, headers, body):
+        match = re.search(r'boundary="?([^";]+)"?', headers.get('content-type', ''))
+        if not match:
+            raise HttpError(400, "Content-Type harus multipart/form-data")
+        async with self.upload_slots:
+            return await self._check_followers(match.group(1).encode('latin-1'), body)
+
+    async def _check_followers(self, boundary, body):
+        loop = asyncio.get_running_loop()
+        tasks = {}
+        pipes = []
+
+        def on_part(name):
+            if name not in EXTRACTORS or name in tasks:
+                return None
+            pipe = _UploadPipe(loop)
+            pipes.append(pipe)
+            tasks[name] = loop.run_in_executor(self.executor, _extract, EXTRACTORS[name], pipe)
+            return pipe
+
+        try:
+            await _parse_multipart(body, boundary, on_part)
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        finally:
+            for pipe in pipes:
+                pipe.finish()
+
+        if len(tasks) != len(EXTRACTORS):
+            for task in tasks.values():
+                task.cancel()
+            raise HttpError(400, "followers_file dan following_file wajib diunggah")
+        try:
+            followers = await tasks['followers_file']
+            following = await tasks['following_file']
+        except Exception as e:
+            raise HttpError(400, f"File JSON tidak valid: {e}")
+
+        return await loop.run_in_executor(self.diff_executor, diff_followers, following, followers)
+
+    def metrics(self):
+        samples = sorted(self.latencies)
+
+        def percentile(p):
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 2) if samples else None
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'latency_ms': {
+                'mean': round(sum(samples) / len(samples), 2) if samples else None,
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': round(samples[-1], 2) if samples else None,
+            },
+        }
+
+    async def dispatch(self, method, path, headers, reader):
+        if path == '/metrics' and method == 'GET':
+            return 200, self.metrics()
+        if path.rstrip('/') != '/api/check-followers':
+            raise HttpError(404, "Endpoint tidak ditemukan")
+        if method == 'OPTIONS':
+            return 204, None
+        if method != 'POST':
+            raise HttpError(405, "Gunakan metode POST")
+        if 'content-length' not in headers:
+            raise HttpError(411, "Header Content-Length wajib ada")
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            raise HttpError(400, "Header Content-Length tidak valid")
+        if length < 0:
+            raise HttpError(400, "Header Content-Length tidak valid")
+        body = _BodyReader(reader, length)
+        if body.remaining > self.max_body:
+            raise HttpError(413, "Ukuran upload terlalu besar")
+        return 200, await self.check_followers(headers, body)
+
+    async def handle(self, reader, writer):
+        start = time.perf_counter()
+        method = path = '-'
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            if len(request_line) < 2:
+                return
+            method, path = request_line[0], request_line[1].split('?', 1)[0]
+            headers = await _read_headers(reader)
+            try:
+                status, payload = await self.dispatch(method, path, headers, reader)
+            except HttpError as e:
+                status, payload = e.status, {'error': str(e)}
+            except Exception as e:
+                status, payload = 500, {'error': str(e)}
+            await self._respond(writer, status, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            status = 400
+        finally:
+            writer.close()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        if path != '/metrics':
+            self.requests += 1
+            self.errors += status >= 400
+            self.latencies.append(elapsed)
+        print(f"{method} {path} {status} {elapsed:.1f}ms")
+
+    async def _respond(self, writer, status, payload):
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Access-Control-Allow-Methods: POST, OPTIONS\r\n"
+            "Access-Control-Allow-Headers: *\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Server berjalan di http://{host}:{port}/api/check-followers/")
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jalankan API cek non-followers secara lokal.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah thread extractor")
+    parser.add_argument('--max-uploads', type=int, default=None,
+                        help="Upload yang diproses bersamaan (default: workers // 2)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(FollowerApi(workers=args.workers, max_uploads=args.max_uploads).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Server dihentikan.")
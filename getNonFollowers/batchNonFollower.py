@@ -0,0 +1,129 @@
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from compactSet import UsernameSet
+from diffFollower import diff_followers
+from snapshotStore import SnapshotStore
+from streamExtract import iter_usernames_followers, iter_usernames_following
+from zipExport import read_export_zip
+
+
+def load_account(path):
+    """
+    Baca username following dan followers dari satu export akun.
+    `path` boleh berupa file ZIP export Instagram atau folder berisi
+    followers_*.json dan following.json.
+    """
+    if os.path.isfile(path) and path.endswith('.zip'):
+        return read_export_zip(path)
+
+    following_files = glob.glob(os.path.join(path, '**', 'following.json'), recursive=True)
+    followers_files = glob.glob(os.path.join(path, '**', 'followers_*.json'), recursive=True)
+    if not following_files or not followers_files:
+        raise FileNotFoundError(f"followers_*.json / following.json tidak ditemukan di {path}")
+
+    followers_files.sort(key=lambda name: int(re.search(r'followers_(\d+)\.json$', name).group(1)))
+    following = list(iter_usernames_following(following_files[0]))
+    followers = [user for name in followers_files for user in iter_usernames_followers(name)]
+    return following, followers
+
+
+def discover_accounts(source):
+    """
+    Kumpulkan daftar akun dari folder (setiap ZIP/subfolder = satu akun)
+    atau dari manifest JSON berbentuk {"nama_akun": "path/export"}.
+    """
+    if os.path.isfile(source):
+        with open(source, 'r') as file:
+            manifest = json.load(file)
+        base = os.path.dirname(os.path.abspath(source))
+        return {account: os.path.join(base, path) for account, path in manifest.items()}
+
+    accounts = {}
+    for entry in sorted(os.listdir(source)):
+        path = os.path.join(source, entry)
+        if entry.endswith('.zip'):
+            accounts[entry[:-len('.zip')]] = path
+        elif os.path.isdir(path):
+            accounts[entry] = path
+    return accounts
+
+
+def process_account(account, path, output_dir, store_dir=None, compact=False):
+    """
+    Worker untuk satu akun: ekstrak, bandingkan, lalu simpan hasilnya.
+    Jika `store_dir` diisi, snapshot disimpan dan perubahan sejak snapshot
+    sebelumnya ikut dilaporkan. `compact` memakai UsernameSet agar hemat memori.
+    """
+    start = time.perf_counter()
+    following, followers = load_account(path)
+    if compact:
+        following, followers = UsernameSet(following), UsernameSet(followers)
+    result = diff_followers(following, followers)
+    if store_dir:
+        result['delta'] = SnapshotStore(store_dir).compare(account, following, followers)
+
+    output_file = os.path.join(output_dir, f"{account}.json")
+    with open(output_file, 'w') as file:
+        json.dump(result, file, indent=4)
+
+    return {
+        'account': account,
+        'output': output_file,
+        'following': len(following),
+        'followers': len(followers),
+        'non_followers': len(result['non_followers']),
+        'fans': len(result['fans']),
+        'mutuals': len(result['mutuals']),
+        'new_unfollowers': len(result.get('delta', {}).get('new_unfollowers', [])),
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def run_batch(source, output_dir, workers=None, store_dir=None, compact=False):
+    """
+    Proses banyak akun secara paralel memakai process pool dan tulis summary.json.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    accounts = discover_accounts(source)
+    summary = {'accounts': [], 'errors': {}}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_account, account, path, output_dir, store_dir, compact): account
+            for account, path in accounts.items()
+        }
+        for future in as_completed(futures):
+            account = futures[future]
+            try:
+                stats = future.result()
+                summary['accounts'].append(stats)
+                print(f"[OK] {account}: {stats['non_followers']} akun tidak mengikuti balik.")
+            except Exception as e:
+                summary['errors'][account] = str(e)
+                print(f"[GAGAL] {account}: {e}")
+
+    summary['accounts'].sort(key=lambda stats: stats['account'])
+    summary_file = os.path.join(output_dir, 'summary.json')
+    with open(summary_file, 'w') as file:
+        json.dump(summary, file, indent=4)
+
+    print(f"{len(summary['accounts'])} akun selesai, {len(summary['errors'])} gagal. Ringkasan di {summary_file}.")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cek non-followers untuk banyak akun sekaligus.")
+    parser.add_argument('source', help="Folder berisi export per akun (ZIP/subfolder) atau manifest JSON")
+    parser.add_argument('-o', '--output', default='hasil_batch', help="Folder output hasil per akun")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Jumlah proses (default: jumlah core)")
+    parser.add_argument('--store', default=None, help="Folder snapshot untuk melacak unfollow sejak run sebelumnya")
+    parser.add_argument('--compact', action='store_true', help="Gunakan representasi username ringkas (hemat memori)")
+    args = parser.parse_args()
+
+    run_batch(args.source, args.output, args.workers, args.store, args.compact)
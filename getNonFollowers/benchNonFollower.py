@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from cekNonFollower import load_export, usernames_from_followers, usernames_from_following
+from compactSet import UsernameSet
+from diffFollower import diff_followers
+from streamExtract import iter_usernames_followers, iter_usernames_following
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+
+def _entry(username, timestamp):
+    return {
+        "title": "",
+        "media_list_data": [],
+        "string_list_data": [
+            {
+                "href": f"https://www.instagram.com/{username}",
+                "value": username,
+                "timestamp": timestamp
+            }
+        ]
+    }
+
+
+def generate_export(directory, size, overlap=0.6, seed=0):
+    """
+    Buat export Instagram sintetis (followers_1.json dan following.json) dengan
+    `size` akun per file; `overlap` adalah porsi akun yang saling mengikuti.
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits + '._'
+    pool = set()
+    while len(pool) < size * (2 - overlap):
+        pool.add(''.join(rng.choices(alphabet, k=rng.randint(5, 20))))
+    pool = list(pool)
+    rng.shuffle(pool)
+
+    mutual_count = int(size * overlap)
+    mutuals = pool[:mutual_count]
+    following = mutuals + pool[mutual_count:size]
+    followers = mutuals + pool[size:size + size - mutual_count]
+    rng.shuffle(following)
+    rng.shuffle(followers)
+
+    now = int(time.time())
+    followers_file = os.path.join(directory, 'followers_1.json')
+    following_file = os.path.join(directory, 'following.json')
+    with open(followers_file, 'w') as file:
+        json.dump([_entry(user, now - i) for i, user in enumerate(followers)], file, indent=2)
+    with open(following_file, 'w') as file:
+        json.dump({"relationships_following": [_entry(user, now - i) for i, user in enumerate(following)]},
+                  file, indent=2)
+    return followers_file, following_file
+
+
+def _measure(func, memory=True):
+    """Jalankan `func` sekali untuk waktu, lalu sekali lagi dengan tracemalloc untuk puncak memori."""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = None
+    if memory:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, {'seconds': round(seconds, 6), 'peak_bytes': peak}
+
+
+def _load(followers_file, following_file):
+    return load_export(followers_file), load_export(following_file)
+
+
+def _extract(followers_data, following_data):
+    return usernames_from_following(following_data), usernames_from_followers(followers_data)
+
+
+def bench_size(size, workdir, memory=True):
+    """Ukur setiap tahap pipeline cekNonFollower.py untuk satu ukuran data."""
+    followers_file, following_file = generate_export(workdir, size)
+    stages = {}
+
+    data, stages['parse'] = _measure(lambda: _load(followers_file, following_file), memory)
+    (following, followers), stages['extract'] = _measure(lambda: _extract(*data), memory)
+    del data
+    _, stages['stream_extract'] = _measure(
+        lambda: (list(iter_usernames_following(following_file)),
+                 list(iter_usernames_followers(followers_file))), memory)
+    result, stages['diff'] = _measure(lambda: diff_followers(following, followers), memory)
+    _, stages['diff_compact'] = _measure(
+        lambda: diff_followers(UsernameSet(following), UsernameSet(followers)), memory)
+
+    output_file = os.path.join(workdir, 'nonFollowers.json')
+
+    def serialize():
+        with open(output_file, 'w') as file:
+            json.dump(result['non_followers'], file, indent=4)
+
+    _, stages['serialize'] = _measure(serialize, memory)
+
+    return {
+        'size': size,
+        'input_bytes': os.path.getsize(followers_file) + os.path.getsize(following_file),
+        'non_followers': len(result['non_followers']),
+        'stages': stages,
+    }
+
+
+def compare_results(current, baseline, threshold=1.2):
+    """
+    Bandingkan dengan hasil sebelumnya; kembalikan daftar tahap yang melambat
+    lebih dari `threshold` kali.
+    """
+    previous = {run['size']: run['stages'] for run in baseline['runs']}
+    regressions = []
+    for run in current['runs']:
+        for stage, stats in run['stages'].items():
+            old = previous.get(run['size'], {}).get(stage)
+            if old and old['seconds'] > 0 and stats['seconds'] / old['seconds'] > threshold:
+                regressions.append(f"{run['size']}/{stage}: {old['seconds']:.4f}s -> {stats['seconds']:.4f}s")
+    return regressions
+
+
+def run_benchmark(sizes, memory=True):
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': [],
+    }
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            run = bench_size(size, workdir, memory)
+        results['runs'].append(run)
+        print(f"\n=== {size:,} akun ({run['input_bytes'] / 1e6:.1f} MB) ===")
+        for stage, stats in run['stages'].items():
+            peak = f"{stats['peak_bytes'] / 1e6:8.1f} MB" if stats['peak_bytes'] is not None else ''
+            print(f"{stage:<15}{stats['seconds']:10.4f}s {peak}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pipeline cek non-followers.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Jumlah akun per export")
+    parser.add_argument('--no-memory', action='store_true', help="Lewati pengukuran puncak memori (tracemalloc)")
+    parser.add_argument('-o', '--output', default='bench_results.json', help="File hasil (JSON)")
+    parser.add_argument('--compare', default=None, help="File hasil sebelumnya untuk deteksi regresi")
+    parser.add_argument('--threshold', type=float, default=1.2, help="Batas rasio perlambatan")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, memory=not args.no_memory)
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=4)
+    print(f"\nHasil benchmark disimpan di {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            regressions = compare_results(results, json.load(file), args.threshold)
+        for line in regressions:
+            print(f"REGRESI {line}")
+        sys.exit(1 if regressions else 0)
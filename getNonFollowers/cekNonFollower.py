@@ -1,16 +1,43 @@
 import json
+import sys
+
+from diffFollower import diff_followers
+from streamExtract import iter_usernames_followers, iter_usernames_following
+from zipExport import read_export_zip
+
+def load_export(input_file):
+    """
+    Membaca file JSON export Instagram (followers_1.json atau following.json).
+    """
+    with open(input_file, 'r') as file:
+        return json.load(file)
+
+def usernames_from_followers(data):
+    """
+    Mengambil username dari 'value' di 'string_list_data' (langsung, tanpa key tambahan).
+    """
+    return [entry['value'] for group in data for entry in group['string_list_data']]
+
+def usernames_from_following(data):
+    """
+    Mengambil username dari 'value' di 'string_list_data' di dalam 'relationships_following'.
+    Mengembalikan None jika kunci 'relationships_following' tidak ada.
+    """
+    if 'relationships_following' not in data:
+        return None
+    usernames = []
+    for group in data['relationships_following']:
+        if 'string_list_data' in group:
+            for entry in group['string_list_data']:
+                usernames.append(entry.get('value'))  # Mendapatkan value dari setiap entry
+    return usernames
 
 def extract_usernames_followers(input_file, output_file):
     """
     Ekstrak username dari file followers JSON dan simpan ke file JSON baru.
     """
     try:
-        # Membaca file JSON input
-        with open(input_file, 'r') as file:
-            data = json.load(file)
-        
-        # Mengambil username dari 'value' di 'string_list_data' (langsung, tanpa key tambahan)
-        usernames = [entry['value'] for group in data for entry in group['string_list_data']]
+        usernames = usernames_from_followers(load_export(input_file))
         
         # Menyimpan username ke file JSON baru
         with open(output_file, 'w') as file:
@@ -25,21 +52,10 @@ def extract_usernames_following(input_file, output_file):
     Ekstrak username dari file following JSON dan simpan ke file JSON baru.
     """
     try:
-        # Membaca file JSON input
-        with open(input_file, 'r') as file:
-            data = json.load(file)
+        usernames = usernames_from_following(load_export(input_file))
         
         # Pastikan data berada di dalam 'relationships_following'
-        if 'relationships_following' in data:
-            relationships = data['relationships_following']
-            
-            # Mengambil username dari 'value' di 'string_list_data'
-            usernames = []
-            for group in relationships:
-                if 'string_list_data' in group:
-                    for entry in group['string_list_data']:
-                        usernames.append(entry.get('value'))  # Mendapatkan value dari setiap entry
-            
+        if usernames is not None:
             # Menyimpan username ke file JSON baru
             with open(output_file, 'w') as file:
                 json.dump(usernames, file, indent=4)
@@ -63,14 +79,52 @@ def check_non_followers(following_file, followers_file, output_file):
         with open(followers_file, 'r') as file:
             followers = json.load(file)
         
-        # Mencari akun yang tidak mengikuti balik
-        non_followers = [user for user in following if user not in followers]
+        # Mencari akun yang tidak mengikuti balik (berbasis set, linear)
+        result = diff_followers(following, followers)
+        non_followers = result['non_followers']
         
         # Menyimpan daftar akun yang tidak mengikuti balik ke file JSON baru
         with open(output_file, 'w') as file:
             json.dump(non_followers, file, indent=4)
         
         print(f"Akun yang tidak mengikuti balik telah disimpan di {output_file}.")
+        print(f"Fans (tidak anda ikuti balik): {len(result['fans'])}, saling mengikuti: {len(result['mutuals'])}.")
+        return result
+    except Exception as e:
+        print(f"Terjadi kesalahan saat memeriksa non-followers: {e}")
+
+def check_non_followers_stream(followers_input, following_input, output_file):
+    """
+    Sama seperti check_non_followers, tetapi langsung membaca file mentah dari Instagram
+    secara streaming tanpa menulis file username perantara.
+    """
+    try:
+        result = diff_followers(iter_usernames_following(following_input),
+                                iter_usernames_followers(followers_input))
+
+        with open(output_file, 'w') as file:
+            json.dump(result['non_followers'], file, indent=4)
+
+        print(f"Akun yang tidak mengikuti balik telah disimpan di {output_file}.")
+        print(f"Fans (tidak anda ikuti balik): {len(result['fans'])}, saling mengikuti: {len(result['mutuals'])}.")
+        return result
+    except Exception as e:
+        print(f"Terjadi kesalahan saat memeriksa non-followers: {e}")
+
+def check_non_followers_zip(zip_path, output_file):
+    """
+    Cek non-followers langsung dari file ZIP hasil unduhan data Instagram.
+    """
+    try:
+        following, followers = read_export_zip(zip_path)
+        result = diff_followers(following, followers)
+
+        with open(output_file, 'w') as file:
+            json.dump(result['non_followers'], file, indent=4)
+
+        print(f"Akun yang tidak mengikuti balik telah disimpan di {output_file}.")
+        print(f"Fans (tidak anda ikuti balik): {len(result['fans'])}, saling mengikuti: {len(result['mutuals'])}.")
+        return result
     except Exception as e:
         print(f"Terjadi kesalahan saat memeriksa non-followers: {e}")
 
@@ -84,16 +138,13 @@ if __name__ == "__main__":
     following_input = 'following.json'
     
     # output file nantinya
-    followers_output = 'usernameFollower.json'
-    following_output = 'usernameFollowing.json'
     non_followers_output = 'nonFollowers.json'
     
-    # Langkah 1: Ekstrak username followers
-    extract_usernames_followers(followers_input, followers_output)
-    
-    # Langkah 2: Ekstrak username following
-    extract_usernames_following(following_input, following_output)
-    
-    # Langkah 3: Cek akun yang tidak mengikuti balik
-    check_non_followers(following_output, followers_output, non_followers_output)
+    # Jika diberikan file ZIP export Instagram, baca langsung tanpa di-unzip
+    # contoh: python cekNonFollower.py instagram-username-2025.zip
+    if len(sys.argv) > 1 and sys.argv[1].endswith('.zip'):
+        check_non_followers_zip(sys.argv[1], non_followers_output)
+    else:
+        # Ekstrak username secara streaming dan langsung cek akun yang tidak mengikuti balik
+        check_non_followers_stream(followers_input, following_input, non_followers_output)
     
\ No newline at end of file
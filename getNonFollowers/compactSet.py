@@ -0,0 +1,116 @@
+from array import array
+
+
+class UsernameSet:
+    """
+    Kumpulan username yang ringkas: semua username (UTF-8, terurut, unik)
+    disimpan dalam satu buffer bytes dipisah newline, ditambah array offset.
+    Jauh lebih hemat memori dibanding list/set berisi objek `str`.
+
+    Mendukung `in`, len(), iterasi (terurut), serta operasi &, |, - secara linear.
+    """
+
+    __slots__ = ('_data', '_offsets')
+
+    def __init__(self, usernames=()):
+        encoded = sorted({user.encode('utf-8') if isinstance(user, str) else bytes(user)
+                          for user in usernames})
+        self._init_sorted(encoded)
+
+    def _init_sorted(self, encoded):
+        self._data = b'\n'.join(encoded)
+        typecode = 'I' if len(self._data) < 2 ** 32 - 1 else 'Q'
+        self._offsets = array(typecode, [0] * (len(encoded) + 1))
+        pos = 0
+        for i, user in enumerate(encoded):
+            self._offsets[i] = pos
+            pos += len(user) + 1
+        self._offsets[len(encoded)] = pos
+
+    @classmethod
+    def _from_sorted(cls, encoded):
+        instance = cls.__new__(cls)
+        instance._init_sorted(encoded)
+        return instance
+
+    @classmethod
+    def from_buffer(cls, data):
+        """Bangun dari buffer bytes terurut dipisah newline (format snapshot)."""
+        return cls._from_sorted(bytes(data).split(b'\n') if data else [])
+
+    @property
+    def buffer(self):
+        return self._data
+
+    @property
+    def nbytes(self):
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def _item(self, index):
+        return self._data[self._offsets[index]:self._offsets[index + 1] - 1]
+
+    def iter_bytes(self):
+        for index in range(len(self)):
+            yield self._item(index)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        for user in self.iter_bytes():
+            yield user.decode('utf-8')
+
+    def __contains__(self, user):
+        key = user.encode('utf-8') if isinstance(user, str) else user
+        low, high = 0, len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self._item(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low < len(self) and self._item(low) == key
+
+    def __eq__(self, other):
+        if not isinstance(other, UsernameSet):
+            return NotImplemented
+        return self._data == other._data and len(self) == len(other)
+
+    def __repr__(self):
+        return f"UsernameSet({len(self)} username, {self.nbytes} bytes)"
+
+    def _merge(self, other, keep_left, keep_both, keep_right):
+        result = []
+        a_iter, b_iter = self.iter_bytes(), other.iter_bytes()
+        a, b = next(a_iter, None), next(b_iter, None)
+        while a is not None and b is not None:
+            if a == b:
+                if keep_both:
+                    result.append(a)
+                a, b = next(a_iter, None), next(b_iter, None)
+            elif a < b:
+                if keep_left:
+                    result.append(a)
+                a = next(a_iter, None)
+            else:
+                if keep_right:
+                    result.append(b)
+                b = next(b_iter, None)
+        if keep_left:
+            while a is not None:
+                result.append(a)
+                a = next(a_iter, None)
+        if keep_right:
+            while b is not None:
+                result.append(b)
+                b = next(b_iter, None)
+        return UsernameSet._from_sorted(result)
+
+    def __and__(self, other):
+        return self._merge(other, False, True, False)
+
+    def __or__(self, other):
+        return self._merge(other, True, True, True)
+
+    def __sub__(self, other):
+        return self._merge(other, True, False, False)
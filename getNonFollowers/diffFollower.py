@@ -0,0 +1,49 @@
+from compactSet import UsernameSet
+
+
+def diff_followers(following, followers):
+    """
+    Bandingkan daftar following dan followers sekali jalan (linear).
+
+    Parameters:
+    following (iterable): Username yang anda ikuti.
+    followers (iterable): Username yang mengikuti anda.
+
+    Returns:
+    dict: 'non_followers' (anda ikuti tapi tidak mengikuti balik),
+          'fans' (mengikuti anda tapi tidak anda ikuti balik) dan
+          'mutuals' (saling mengikuti). Urutan non_followers dan mutuals
+          mengikuti urutan following, fans mengikuti urutan followers.
+          Jika kedua input berupa UsernameSet, hasil dihitung dengan merge
+          linear dan urutannya alfabetis (urutan bytes UTF-8).
+    """
+    if isinstance(following, UsernameSet) and isinstance(followers, UsernameSet):
+        return {
+            'non_followers': list(following - followers),
+            'fans': list(followers - following),
+            'mutuals': list(following & followers),
+        }
+
+    # Set dibangun sekali, lookup O(1) menggantikan `user not in list`
+    followers = list(dict.fromkeys(followers))
+    followers_set = set(followers)
+    following_set = set()
+
+    non_followers = []
+    mutuals = []
+    for user in following:
+        if user in following_set:
+            continue  # Lewati username duplikat
+        following_set.add(user)
+        if user in followers_set:
+            mutuals.append(user)
+        else:
+            non_followers.append(user)
+
+    fans = [user for user in followers if user not in following_set]
+
+    return {
+        'non_followers': non_followers,
+        'fans': fans,
+        'mutuals': mutuals,
+    }
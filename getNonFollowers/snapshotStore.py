@@ -0,0 +1,160 @@
+import argparse
+import json
+import mmap
+import os
+from datetime import date
+
+from compactSet import UsernameSet
+
+MAGIC = b'IGSNAP1\n'
+
+
+def write_snapshot(path, usernames):
+    """
+    Simpan username sebagai array terurut dan unik (UTF-8, dipisah newline)
+    sehingga bisa di-mmap dan dibandingkan secara linear.
+    """
+    if not isinstance(usernames, UsernameSet):
+        usernames = UsernameSet(usernames)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(usernames.buffer)
+    os.replace(tmp_path, path)
+    return len(usernames)
+
+
+def load_snapshot(path):
+    """
+    Muat snapshot sebagai UsernameSet (satu buffer, tanpa objek str per username).
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} bukan file snapshot yang valid")
+    return UsernameSet.from_buffer(data[len(MAGIC):])
+
+
+def iter_snapshot(path):
+    """
+    Yield username (bytes) dari snapshot secara berurutan lewat mmap.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size <= len(MAGIC):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} bukan file snapshot yang valid")
+            pos = len(MAGIC)
+            size = len(mapped)
+            while pos < size:
+                end = mapped.find(b'\n', pos)
+                if end == -1:
+                    end = size
+                yield mapped[pos:end]
+                pos = end + 1
+
+
+def merge_diff(old, new):
+    """
+    Bandingkan dua urutan terurut secara linear (merge).
+
+    Returns:
+    tuple: (removed, added) — ada di old tapi tidak di new, dan sebaliknya.
+    """
+    removed, added = [], []
+    old, new = iter(old), iter(new)
+    a, b = next(old, None), next(new, None)
+    while a is not None and b is not None:
+        if a == b:
+            a, b = next(old, None), next(new, None)
+        elif a < b:
+            removed.append(a)
+            a = next(old, None)
+        else:
+            added.append(b)
+            b = next(new, None)
+    while a is not None:
+        removed.append(a)
+        a = next(old, None)
+    while b is not None:
+        added.append(b)
+        b = next(new, None)
+    return removed, added
+
+
+def _decode(users):
+    return [user.decode('utf-8') for user in users]
+
+
+class SnapshotStore:
+    """
+    Penyimpanan snapshot per akun per tanggal:
+    <root>/<akun>/<YYYY-MM-DD>.followers.snap dan .following.snap
+    """
+
+    def __init__(self, root='snapshots'):
+        self.root = root
+
+    def _path(self, account, day, kind):
+        return os.path.join(self.root, account, f"{day}.{kind}.snap")
+
+    def dates(self, account):
+        account_dir = os.path.join(self.root, account)
+        if not os.path.isdir(account_dir):
+            return []
+        return sorted({name.split('.', 1)[0] for name in os.listdir(account_dir)
+                       if name.endswith('.followers.snap')})
+
+    def latest(self, account, before=None):
+        """Tanggal snapshot terakhir (opsional sebelum tanggal `before`)."""
+        days = [day for day in self.dates(account) if before is None or day < before]
+        return days[-1] if days else None
+
+    def save(self, account, following, followers, day=None):
+        day = day or date.today().isoformat()
+        os.makedirs(os.path.join(self.root, account), exist_ok=True)
+        write_snapshot(self._path(account, day, 'following'), following)
+        write_snapshot(self._path(account, day, 'followers'), followers)
+        return day
+
+    def compare(self, account, following, followers, day=None):
+        """
+        Simpan snapshot baru lalu bandingkan dengan snapshot sebelumnya.
+
+        Returns:
+        dict: unfollowers baru, followers baru, churn, dan perubahan following.
+        """
+        day = self.save(account, following, followers, day)
+        previous = self.latest(account, before=day)
+        report = {'account': account, 'date': day, 'previous': previous}
+        if previous is None:
+            return report
+
+        lost, gained = merge_diff(iter_snapshot(self._path(account, previous, 'followers')),
+                                  iter_snapshot(self._path(account, day, 'followers')))
+        unfollowed, followed = merge_diff(iter_snapshot(self._path(account, previous, 'following')),
+                                          iter_snapshot(self._path(account, day, 'following')))
+        report.update({
+            'new_unfollowers': _decode(lost),
+            'new_followers': _decode(gained),
+            'churn': len(lost) + len(gained),
+            'you_unfollowed': _decode(unfollowed),
+            'you_followed': _decode(followed),
+        })
+        return report
+
+
+if __name__ == "__main__":
+    from batchNonFollower import load_account
+
+    parser = argparse.ArgumentParser(description="Lacak siapa yang unfollow sejak snapshot terakhir.")
+    parser.add_argument('account', help="Nama akun")
+    parser.add_argument('export', help="File ZIP export Instagram atau folder berisi file JSON")
+    parser.add_argument('--store', default='snapshots', help="Folder penyimpanan snapshot")
+    parser.add_argument('--date', default=None, help="Tanggal snapshot (YYYY-MM-DD), default hari ini")
+    args = parser.parse_args()
+
+    following, followers = load_account(args.export)
+    report = SnapshotStore(args.store).compare(args.account, following, followers, args.date)
+    print(json.dumps(report, indent=4))
@@ -0,0 +1,134 @@
+import io
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _JsonStream:
+    """
+    Pembaca JSON bertahap: hanya menyimpan potongan (chunk) yang sedang diproses,
+    sehingga memori tetap datar berapa pun ukuran file export.
+    """
+
+    def __init__(self, file, chunk_size=65536):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Buang bagian buffer yang sudah diproses
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Karakter non-whitespace berikutnya (tanpa mengonsumsi), '' jika EOF."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Format JSON tidak sesuai: diharapkan '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode satu nilai JSON lengkap mulai dari posisi sekarang."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Angka di ujung buffer bisa saja belum lengkap
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def items(self):
+        """Yield setiap elemen array JSON satu per satu."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == ']':
+                return
+            if sep != ',':
+                raise ValueError("Format JSON tidak sesuai: array tidak valid")
+
+    def find_key(self, key):
+        """Maju ke nilai milik `key` di objek tingkat atas, lewati key lainnya."""
+        self.expect('{')
+        while self.peek() not in ('}', ''):
+            name = self.value()
+            self.expect(':')
+            if name == key:
+                return True
+            self.value()
+            if self.peek() == ',':
+                self.pos += 1
+        return False
+
+
+def _open_text(source):
+    """Terima path atau file object (teks/biner) dan kembalikan file object teks."""
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        return open(source, 'r', encoding='utf-8'), True
+    if isinstance(source, io.TextIOBase):
+        return source, False
+    return io.TextIOWrapper(source, encoding='utf-8'), False
+
+
+def _iter_values(groups):
+    for group in groups:
+        for entry in group.get('string_list_data', []):
+            value = entry.get('value')
+            if value is not None:
+                yield value
+
+
+def iter_usernames_followers(source, chunk_size=65536):
+    """
+    Stream username dari file followers (array berisi 'string_list_data').
+    """
+    file, owned = _open_text(source)
+    try:
+        yield from _iter_values(_JsonStream(file, chunk_size).items())
+    finally:
+        if owned:
+            file.close()
+
+
+def iter_usernames_following(source, chunk_size=65536):
+    """
+    Stream username dari file following (objek dengan 'relationships_following').
+    """
+    file, owned = _open_text(source)
+    try:
+        stream = _JsonStream(file, chunk_size)
+        if not stream.find_key('relationships_following'):
+            raise KeyError("Kunci 'relationships_following' tidak ditemukan dalam file JSON.")
+        yield from _iter_values(stream.items())
+    finally:
+        if owned:
+            file.close()
@@ -0,0 +1,59 @@
+import asyncio
+import json
+import unittest
+
+from apiServer import FollowerApi
+
+
+def _export(count, prefix):
+    followers = [{"string_list_data": [{"value": f"{prefix}{i}"}]} for i in range(count)]
+    following = {"relationships_following": [{"string_list_data": [{"value": f"{prefix}{i}"}]}
+                                             for i in range(count // 2, count + count // 2)]}
+    return json.dumps(followers).encode('utf-8'), json.dumps(following).encode('utf-8')
+
+
+def _multipart(boundary, fields):
+    body = b''
+    for name, content in fields:
+        body += (f"--{boundary}\r\n"
+                 f'Content-Disposition: form-data; name="{name}"; filename="{name}.json"\r\n'
+                 "Content-Type: application/json\r\n\r\n").encode('latin-1') + content + b'\r\n'
+    return body + f"--{boundary}--\r\n".encode('latin-1')
+
+
+async def _post(port, body, boundary):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write((f"POST /api/check-followers/ HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Type: multipart/form-data; boundary={boundary}\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload)
+
+
+class ConcurrentUploadTest(unittest.TestCase):
+    def test_more_uploads_than_workers(self):
+        # Upload besar (lebih dari max_pending potongan per part) dan lebih banyak
+        # dari jumlah worker tidak boleh saling menunggu selamanya
+        async def scenario():
+            api = FollowerApi(workers=2)
+            server = await asyncio.start_server(api.handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            followers, following = _export(40000, 'user_')
+            body = _multipart('XYZ', [('followers_file', followers), ('following_file', following)])
+            async with server:
+                return await asyncio.wait_for(
+                    asyncio.gather(*(_post(port, body, 'XYZ') for _ in range(6))), timeout=60)
+
+        results = asyncio.run(scenario())
+        for status, payload in results:
+            self.assertEqual(status, 200)
+            self.assertEqual(len(payload['non_followers']), 20000)
+            self.assertEqual(len(payload['fans']), 20000)
+            self.assertEqual(len(payload['mutuals']), 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from streamExtract import iter_usernames_followers, iter_usernames_following
+
+# Nama file di dalam ZIP export Instagram, mis.
+# connections/followers_and_following/followers_1.json
+_FOLLOWERS_PATTERN = re.compile(r'(?:^|/)followers_(\d+)\.json$')
+_FOLLOWING_PATTERN = re.compile(r'(?:^|/)following\.json$')
+
+
+def find_export_members(zip_path):
+    """
+    Cari semua shard followers_*.json (urut sesuai nomor) dan following.json di dalam ZIP.
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        names = archive.namelist()
+
+    followers = sorted(
+        (name for name in names if _FOLLOWERS_PATTERN.search(name)),
+        key=lambda name: int(_FOLLOWERS_PATTERN.search(name).group(1))
+    )
+    following = [name for name in names if _FOLLOWING_PATTERN.search(name)]
+
+    if not followers:
+        raise FileNotFoundError(f"File followers_*.json tidak ditemukan di {zip_path}")
+    if not following:
+        raise FileNotFoundError(f"File following.json tidak ditemukan di {zip_path}")
+    return followers, following[0]
+
+
+def _read_member(zip_path, name, extractor):
+    # Setiap thread membuka handle ZIP sendiri; dekompresi berjalan streaming
+    with zipfile.ZipFile(zip_path) as archive:
+        with archive.open(name) as member:
+            return list(extractor(member))
+
+
+def read_export_zip(zip_path, max_workers=None):
+    """
+    Baca username following dan followers langsung dari ZIP export Instagram
+    tanpa mengekstrak ke disk. Setiap shard didekompresi secara paralel.
+
+    Returns:
+    tuple: (following, followers) berupa list username.
+    """
+    followers_names, following_name = find_export_members(zip_path)
+    workers = max_workers or min(len(followers_names) + 1, (os.cpu_count() or 1) + 4)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        following_future = executor.submit(_read_member, zip_path, following_name,
+                                           iter_usernames_following)
+        followers_futures = [
+            executor.submit(_read_member, zip_path, name, iter_usernames_followers)
+            for name in followers_names
+        ]
+        followers = [user for future in followers_futures for user in future.result()]
+        following = following_future.result()
+
+    return following, followers
@@ -0,0 +1,180 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+
+def _init_worker(intra_threads, inter_threads):
+    """
+    Set sebelum TensorFlow di-import: paksa CPU dan batasi thread per proses,
+    supaya beberapa fold bisa jalan bersamaan tanpa saling berebut core.
+    """
+    os.environ['CUDA_VISIBLE_DEVICES'] = '-1'
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(intra_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_threads)
+
+
+def walk_forward_splits(n_rows, folds, test_size, min_train_rows=1):
+    """
+    Bagi data secara walk-forward (expanding window). Fold dengan data latih
+    kurang dari `min_train_rows` baris dibuang.
+
+    Returns:
+    list: (fold, train_end, test_end) untuk setiap fold; data latih values[:train_end],
+          data uji values[train_end:test_end].
+    """
+    splits = []
+    for fold in range(folds):
+        train_end = n_rows - (folds - fold) * test_size
+        if train_end >= min_train_rows:
+            splits.append((fold, train_end, train_end + test_size))
+    return splits
+
+
+def _min_train_rows(config):
+    """Baris latih minimum: lebih dari seq_length + horizon (run_fold memakai horizon 1)."""
+    return config['seq_length'] + 2
+
+
+def run_fold(values, train_end, test_end, config):
+    """
+    Latih satu model pada values[:train_end] lalu prediksi satu langkah ke depan
+    untuk setiap titik uji (memakai riwayat asli sampai titik tersebut).
+    """
+    from hk import NumberPredictor
+
+    predictor = NumberPredictor(None, seq_length=config['seq_length'],
+                                lstm_units=config.get('lstm_units', (100, 50)))
+    train_df = pd.DataFrame({'angka': values[:train_end]})
+
+    start = time.perf_counter()
+    X, y = predictor.preprocess_data(train_df)
+    predictor.model = predictor.build_model()
+    predictor.model.fit(X, y, epochs=config['epochs'], batch_size=config.get('batch_size', 32), verbose=0)
+    train_seconds = time.perf_counter() - start
+
+    # Semua jendela uji diprediksi dalam satu batch
+    start = time.perf_counter()
+    seq = predictor.seq_length
+    scaled = predictor.scaler.transform(values[:test_end].reshape(-1, 1))[:, 0]
+    X_test = np.stack([scaled[i - seq:i] for i in range(train_end, test_end)])[..., np.newaxis]
+    predicted = predictor.scaler.inverse_transform(
+        predictor.model.predict(X_test, verbose=0)[:, :1]
+    )[:, 0]
+    predict_seconds = time.perf_counter() - start
+
+    actual = values[train_end:test_end].astype(float)
+    errors = predicted - actual
+    return {
+        'config': config,
+        'train_rows': int(train_end),
+        'test_rows': int(test_end - train_end),
+        'mae': float(np.mean(np.abs(errors))),
+        'rmse': float(np.sqrt(np.mean(errors ** 2))),
+        'exact_rate': float(np.mean(np.rint(predicted) == actual)),
+        'train_seconds': round(train_seconds, 3),
+        'predict_seconds': round(predict_seconds, 3),
+    }
+
+
+def run_backtest(values, configs, folds=5, test_size=20, workers=None, intra_threads=1, inter_threads=1):
+    """
+    Jalankan semua kombinasi (config, fold) secara paralel, satu proses per fold.
+    """
+    values = np.asarray(values)
+    config_splits = []
+    for config in configs:
+        splits = walk_forward_splits(len(values), folds, test_size, _min_train_rows(config))
+        if len(splits) < folds:
+            print(f"Peringatan: seq={config['seq_length']} hanya {len(splits)} dari {folds} fold "
+                  f"punya cukup data latih.")
+        config_splits.append((config, splits))
+    if not any(splits for _, splits in config_splits):
+        raise ValueError(f"Data terlalu sedikit ({len(values)} baris) untuk {folds} fold "
+                         f"dengan test_size={test_size}.")
+    workers = workers or max(1, (os.cpu_count() or 1) // max(1, intra_threads))
+
+    # spawn: proses anak memulai TensorFlow dari awal, bukan hasil fork
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(intra_threads, inter_threads)) as executor:
+        futures = [
+            (fold, executor.submit(run_fold, values, train_end, test_end, config))
+            for config, splits in config_splits
+            for fold, train_end, test_end in splits
+        ]
+        for fold, future in futures:
+            result = future.result()
+            result['fold'] = fold
+            results.append(result)
+            print(f"seq={result['config']['seq_length']:<3} epochs={result['config']['epochs']:<4} "
+                  f"units={result['config'].get('lstm_units', (100, 50))} fold={fold} "
+                  f"MAE={result['mae']:.2f} RMSE={result['rmse']:.2f} tepat={result['exact_rate']:.1%} "
+                  f"latih={result['train_seconds']}s")
+    return results
+
+
+def summarize(results):
+    """Rata-rata metrik per konfigurasi, diurutkan dari MAE terkecil."""
+    summary = {}
+    for result in results:
+        key = json.dumps(result['config'], sort_keys=True)
+        summary.setdefault(key, []).append(result)
+    rows = []
+    for key, fold_results in summary.items():
+        rows.append({
+            'config': json.loads(key),
+            'mae': float(np.mean([r['mae'] for r in fold_results])),
+            'rmse': float(np.mean([r['rmse'] for r in fold_results])),
+            'exact_rate': float(np.mean([r['exact_rate'] for r in fold_results])),
+            'train_seconds': float(np.sum([r['train_seconds'] for r in fold_results])),
+        })
+    return sorted(rows, key=lambda row: row['mae'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest walk-forward paralel untuk NumberPredictor.")
+    parser.add_argument('--cache', default='data_cache.joblib', help="File data (joblib DataFrame 'angka')")
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--test-size', type=int, default=20)
+    parser.add_argument('--seq-lengths', type=int, nargs='+', default=[5])
+    parser.add_argument('--epochs', type=int, nargs='+', default=[50])
+    parser.add_argument('--units', nargs='+', default=['100,50'], help="Arsitektur LSTM, mis. 100,50 64")
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--intra-threads', type=int, default=1)
+    parser.add_argument('--inter-threads', type=int, default=1)
+    parser.add_argument('-o', '--output', default='backtest_results.json')
+    args = parser.parse_args()
+
+    values = joblib.load(args.cache)['angka'].values
+    configs = [
+        {'seq_length': seq, 'epochs': epochs, 'batch_size': args.batch_size,
+         'lstm_units': [int(u) for u in units.split(',')]}
+        for seq, epochs, units in itertools.product(args.seq_lengths, args.epochs, args.units)
+    ]
+
+    start = time.perf_counter()
+    results = run_backtest(values, configs, args.folds, args.test_size, args.workers,
+                           args.intra_threads, args.inter_threads)
+    summary = summarize(results)
+
+    print("\n=== Ringkasan (urut MAE) ===")
+    for row in summary:
+        print(f"{row['config']}: MAE={row['mae']:.2f} RMSE={row['rmse']:.2f} "
+              f"tepat={row['exact_rate']:.1%} total latih={row['train_seconds']:.1f}s")
+
+    with open(args.output, 'w') as f:
+        json.dump({'folds': results, 'summary': summary,
+                   'wall_seconds': round(time.perf_counter() - start, 3)}, f, indent=4)
+    print(f"\nHasil backtest tersimpan di: {args.output}")
@@ -1,74 +1,247 @@
 import requests
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import tensorflow as tf
+from tensorflow.keras.callbacks import Callback, EarlyStopping
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization
 from sklearn.preprocessing import MinMaxScaler
-from concurrent.futures import ThreadPoolExecutor
-from bs4 import BeautifulSoup
-from itertools import permutations
+from html.parser import HTMLParser
+from collections import Counter
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import joblib
+import hashlib
+import json
 import time
 import os
 
+try:
+    import lxml.html
+except ImportError:  # Parser bawaan dipakai jika lxml tidak terpasang
+    lxml = None
+
+class _TableParser(HTMLParser):
+    """Ambil angka dari sel <td> di dalam tabel #myTable (fallback tanpa lxml)."""
+
+    def __init__(self, table_id='myTable'):
+        super().__init__()
+        self.table_id = table_id
+        self.depth = 0      # Kedalaman <table> sejak #myTable
+        self.in_cell = 0
+        self.text = []
+        self.numbers = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table' and (self.depth or dict(attrs).get('id') == self.table_id):
+            self.depth += 1
+        elif self.depth and tag == 'td':
+            if not self.in_cell:
+                self.text = []
+            self.in_cell += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'table' and self.depth:
+            self.depth -= 1
+        elif self.depth and tag == 'td' and self.in_cell:
+            self.in_cell -= 1
+            value = ''.join(self.text).strip()
+            if value.isdigit():
+                self.numbers.append(int(value))
+
+    def handle_data(self, data):
+        if self.in_cell:
+            self.text.append(data)
+
+def parse_table(content, table_id='myTable'):
+    """
+    Ambil semua angka dari sel tabel #myTable sesuai urutan halaman.
+    """
+    if lxml is not None:
+        doc = lxml.html.fromstring(content)
+        tables = doc.xpath(f'//table[@id="{table_id}"]')
+        numbers = []
+        for table in tables[:1]:
+            for row in table.iter('tr'):
+                for col in row.iter('td'):
+                    value = col.text_content().strip()
+                    if value.isdigit():
+                        numbers.append(int(value))
+        return numbers
+
+    parser = _TableParser(table_id)
+    parser.feed(content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content)
+    parser.close()
+    return parser.numbers
+
+def merge_new_rows(stored, fetched, min_overlap=3):
+    """
+    Kembalikan angka dari `fetched` yang lebih baru dari data tersimpan.
+    Halaman dianggap cocok jika awal halaman sama persis dengan ekor data
+    tersimpan sepanjang minimal `min_overlap` baris (atau seluruh data tersimpan
+    jika lebih pendek), atau seluruh data tersimpan muncul berurutan di halaman.
+
+    Returns:
+        list baris baru, atau None jika halaman tidak cocok dengan data tersimpan
+        (mis. situs mengoreksi data lama).
+    """
+    fetched = list(fetched)
+    if not stored:
+        return fetched
+    stored = list(stored)
+    # Data tersimpan seluruhnya ada di halaman
+    if len(fetched) >= len(stored):
+        for i in range(len(fetched) - len(stored), -1, -1):
+            if fetched[i:i + len(stored)] == stored:
+                return fetched[i + len(stored):]
+    # Halaman dimulai di tengah data tersimpan: overlap terpanjang dulu
+    for k in range(min(len(stored), len(fetched)), min(min_overlap, len(stored)) - 1, -1):
+        if fetched[:k] == stored[-k:]:
+            return fetched[k:]
+    return None
+
+def configure_threads(intra_op_threads=None, inter_op_threads=None):
+    """
+    Atur jumlah thread TensorFlow (0/None = otomatis). Harus dipanggil sebelum
+    operasi TensorFlow pertama dijalankan.
+    """
+    if intra_op_threads is not None:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    if inter_op_threads is not None:
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+class ThroughputLogger(Callback):
+    """Catat jumlah sampel per detik di setiap epoch."""
+
+    def __init__(self, samples):
+        super().__init__()
+        self.samples = samples
+        self.throughput = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        rate = self.samples / (time.perf_counter() - self._start)
+        self.throughput.append(rate)
+        if logs is not None:
+            logs['samples_per_sec'] = rate
+
 class NumberPredictor:
-    def __init__(self, url, seq_length=5, cache_file='data_cache.joblib'):
+    # Naikkan jika arsitektur di build_model berubah agar cache model lama tidak dipakai
+    MODEL_VERSION = 1
+
+    def __init__(self, url, seq_length=5, cache_file='data_cache.joblib', horizon=1, dtype=None,
+                 model_dir='model_cache', refresh_ttl=6 * 3600, lstm_units=(100, 50)):
         self.url = url
         self.seq_length = seq_length
+        self.lstm_units = tuple(lstm_units)  # Ukuran tiap lapisan LSTM
+        self.horizon = horizon  # Jumlah langkah ke depan yang diprediksi
+        self.dtype = dtype      # Mis. np.float32 untuk menghemat memori
         self.cache_file = cache_file
+        self.meta_file = cache_file + '.meta.json'
+        self.refresh_ttl = refresh_ttl  # Detik sebelum data dicek ulang ke server
+        self.session = requests.Session()
+        self.model_dir = model_dir
         self.scaler = MinMaxScaler(feature_range=(0, 1))
         self.model = None
         
-    def fetch_data(self):
-        # Cek cache
-        if os.path.exists(self.cache_file):
-            return joblib.load(self.cache_file)
-            
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(requests.get, self.url)
-            response = future.result()
-            
+    def _load_meta(self):
+        try:
+            with open(self.meta_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_meta(self, meta):
+        with open(self.meta_file, 'w') as f:
+            json.dump(meta, f)
+
+    def fetch_data(self, force=False):
+        """
+        Ambil data dengan cache: dalam masa TTL cache langsung dipakai, setelahnya
+        dikirim request kondisional (ETag/Last-Modified) dan hanya baris baru
+        yang ditambahkan ke cache.
+        """
+        cached = joblib.load(self.cache_file) if os.path.exists(self.cache_file) else None
+        meta = self._load_meta() if cached is not None else {}
+
+        # Cek cache (TTL)
+        if cached is not None and not force and time.time() - meta.get('fetched_at', 0) < self.refresh_ttl:
+            return cached
+
+        headers = {}
+        if cached is not None and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if cached is not None and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.session.get(self.url, headers=headers, timeout=30)
+        if response.status_code == 304 and cached is not None:
+            meta['fetched_at'] = time.time()
+            self._save_meta(meta)
+            return cached
         if response.status_code != 200:
             raise Exception("Gagal mengakses URL")
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        data_numbers = []
-        
-        # Optimasi parsing HTML
-        rows = soup.select('#myTable tr')
-        for row in rows:
-            numbers = [int(col.text.strip()) for col in row.find_all('td') 
-                      if col.text.strip().isdigit()]
-            data_numbers.extend(numbers)
-            
-        df = pd.DataFrame(data_numbers, columns=['angka'])
-        joblib.dump(df, self.cache_file)
+
+        stored = cached['angka'].tolist() if cached is not None else []
+        fetched = parse_table(response.content)
+        new_numbers = merge_new_rows(stored, fetched)
+        df = cached if cached is not None else pd.DataFrame({'angka': pd.Series([], dtype='int64')})
+        if new_numbers is None:
+            # Jangan tambahkan ulang seluruh halaman ke cache; ganti dengan tabel terbaru
+            print("Peringatan: data tersimpan tidak cocok dengan halaman, cache diganti dengan data halaman.")
+            df = pd.DataFrame({'angka': pd.Series(fetched, dtype='int64')})
+            joblib.dump(df, self.cache_file)
+        elif new_numbers:
+            df = pd.concat([df, pd.DataFrame(new_numbers, columns=['angka'])], ignore_index=True)
+            joblib.dump(df, self.cache_file)
+        elif cached is None:
+            joblib.dump(df, self.cache_file)
+
+        self._save_meta({
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        })
+        if new_numbers is not None:
+            print(f"{len(new_numbers)} data baru ditambahkan.")
         return df
 
-    def preprocess_data(self, df):
+    def preprocess_data(self, df, fit_scaler=True):
         data = df['angka'].values.reshape(-1, 1)
-        data_scaled = self.scaler.fit_transform(data)
+        if fit_scaler:
+            data_scaled = self.scaler.fit_transform(data)
+        else:
+            data_scaled = self.scaler.transform(data)
+        if self.dtype is not None:
+            data_scaled = data_scaled.astype(self.dtype, copy=False)
+        series = data_scaled[:, 0]
         
-        X, y = [], []
-        for i in range(len(data_scaled) - self.seq_length):
-            X.append(data_scaled[i:i+self.seq_length])
-            y.append(data_scaled[i+self.seq_length])
+        # Sliding window berupa view (stride tricks), tanpa loop dan tanpa salinan
+        window = self.seq_length + self.horizon
+        if len(series) < window:
+            return (np.empty((0, self.seq_length, 1), dtype=series.dtype),
+                    np.empty((0, self.horizon), dtype=series.dtype))
+        windows = sliding_window_view(series, window)
+        X = windows[:, :self.seq_length, np.newaxis]
+        y = windows[:, self.seq_length:]
             
-        return np.array(X), np.array(y)
+        return X, y
 
     def build_model(self):
-        model = Sequential([
-            LSTM(100, activation='relu', input_shape=(self.seq_length, 1), 
-                 return_sequences=True),
-            Dropout(0.2),
-            BatchNormalization(),
-            LSTM(50, activation='relu'),
-            Dropout(0.2),
-            BatchNormalization(),
+        layers = []
+        for i, units in enumerate(self.lstm_units):
+            extra = {'input_shape': (self.seq_length, 1)} if i == 0 else {}
+            layers += [
+                LSTM(units, activation='relu', return_sequences=i < len(self.lstm_units) - 1, **extra),
+                Dropout(0.2),
+                BatchNormalization(),
+            ]
+        model = Sequential(layers + [
             Dense(25, activation='relu'),
-            Dense(1)
+            Dense(self.horizon)
         ])
         model.compile(optimizer='adam', loss='huber')
         return model
@@ -81,23 +254,169 @@ class NumberPredictor:
                       validation_split=0.2,
                       verbose=1)
 
+    def make_datasets(self, data_scaled, batch_size=32, validation_split=0.2, shuffle_buffer=1024):
+        """
+        Pipeline tf.data: windowing langsung dari deret yang sudah diskalakan,
+        cache, shuffle, batch dan prefetch. 20% jendela terakhir jadi validasi
+        (sama seperti validation_split di train_model).
+        """
+        window = self.seq_length + self.horizon
+        n_samples = len(data_scaled) - window + 1
+        n_train = n_samples - int(n_samples * validation_split)
+
+        series = tf.data.Dataset.from_tensor_slices(np.asarray(data_scaled, dtype=np.float32).reshape(-1))
+        windows = series.window(window, shift=1, drop_remainder=True).flat_map(lambda w: w.batch(window))
+        windows = windows.map(
+            lambda w: (tf.expand_dims(w[:self.seq_length], -1), w[self.seq_length:]),
+            num_parallel_calls=tf.data.AUTOTUNE,
+        )
+
+        train = (windows.take(n_train).cache()
+                 .shuffle(min(shuffle_buffer, max(1, n_train)), reshuffle_each_iteration=True)
+                 .batch(batch_size).prefetch(tf.data.AUTOTUNE))
+        validation = windows.skip(n_train).cache().batch(batch_size).prefetch(tf.data.AUTOTUNE)
+        return train, validation, n_train
+
+    def train_model_pipeline(self, df, epochs=300, batch_sizes=(32,), patience=20, shuffle_buffer=1024):
+        """
+        Latih dengan tf.data dan early stopping. `batch_sizes` berisi satu atau
+        beberapa ukuran batch yang dipakai bergantian per fase (mis. (32, 128)),
+        jatah epoch dibagi rata antar fase.
+        """
+        data_scaled = self.scaler.fit_transform(df['angka'].values.reshape(-1, 1))
+        self.model = self.build_model()
+        phase_epochs = max(1, epochs // len(batch_sizes))
+        self.throughput = []
+
+        for batch_size in batch_sizes:
+            train, validation, n_train = self.make_datasets(data_scaled, batch_size, shuffle_buffer=shuffle_buffer)
+            throughput = ThroughputLogger(n_train)
+            early_stopping = EarlyStopping(monitor='val_loss', patience=patience, restore_best_weights=True)
+            self.model.fit(train,
+                           validation_data=validation,
+                           epochs=phase_epochs,
+                           callbacks=[throughput, early_stopping],
+                           verbose=1)
+            self.throughput.extend(throughput.throughput)
+            if throughput.throughput:
+                print(f"Batch {batch_size}: rata-rata {np.mean(throughput.throughput):.0f} sampel/detik "
+                      f"selama {len(throughput.throughput)} epoch")
+            if early_stopping.stopped_epoch:
+                print(f"Early stopping pada epoch {early_stopping.stopped_epoch + 1} (batch {batch_size}).")
+                break
+
+    def _model_key(self, epochs, batch_size):
+        # Hyperparameter menentukan folder cache model
+        params = {
+            'version': self.MODEL_VERSION,
+            'seq_length': self.seq_length,
+            'horizon': self.horizon,
+            'lstm_units': list(self.lstm_units),
+            'epochs': epochs,
+            'batch_size': batch_size,
+        }
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _data_hash(values):
+        return hashlib.sha256(np.ascontiguousarray(values, dtype=np.int64).tobytes()).hexdigest()
+
+    def train_or_load(self, df, epochs=300, batch_size=32, fine_tune_epochs=30, pipeline=False):
+        """
+        Muat model + scaler dari cache jika data dan hyperparameter sama,
+        fine-tune hanya pada baris baru jika data bertambah, atau latih ulang penuh.
+        Dengan pipeline=True pelatihan penuh memakai train_model_pipeline.
+        """
+        values = df['angka'].values
+        model_key = self._model_key(epochs, batch_size) + ('-pipeline' if pipeline else '')
+        model_path = os.path.join(self.model_dir, model_key)
+        weights_file = os.path.join(model_path, 'model.weights.h5')
+        meta_file = os.path.join(model_path, 'meta.joblib')
+
+        meta = joblib.load(meta_file) if os.path.exists(meta_file) and os.path.exists(weights_file) else None
+        if meta and meta['rows'] <= len(values) and self._data_hash(values[:meta['rows']]) == meta['data_hash']:
+            self.scaler = meta['scaler']
+            self.model = self.build_model()
+            self.model.load_weights(weights_file)
+
+            if meta['rows'] == len(values):
+                print("Model dari cache dipakai (data tidak berubah).")
+                return 'loaded'
+
+            # Hanya jendela yang menyentuh baris baru, scaler lama dipertahankan
+            print(f"Fine-tuning model dengan {len(values) - meta['rows']} baris baru...")
+            start = max(0, meta['rows'] - self.seq_length - self.horizon + 1)
+            X, y = self.preprocess_data(df.iloc[start:], fit_scaler=False)
+            if len(X):
+                self.model.fit(X, y, epochs=fine_tune_epochs, batch_size=batch_size, verbose=1)
+            status = 'fine-tuned'
+        elif pipeline:
+            self.train_model_pipeline(df, epochs=epochs, batch_sizes=(batch_size,))
+            status = 'trained'
+        else:
+            X, y = self.preprocess_data(df)
+            self.train_model(X, y, epochs=epochs, batch_size=batch_size)
+            status = 'trained'
+
+        os.makedirs(model_path, exist_ok=True)
+        self.model.save_weights(weights_file)
+        joblib.dump({'scaler': self.scaler, 'rows': len(values), 'data_hash': self._data_hash(values)}, meta_file)
+        return status
+
+    def export_numpy(self, path='model_numpy.npz'):
+        """
+        Simpan bobot model + parameter scaler ke .npz untuk predicts/infer.py
+        (inferensi NumPy murni, tanpa TensorFlow saat runtime).
+        """
+        arrays = {
+            'scaler_min': np.float64(self.scaler.min_[0]),
+            'scaler_scale': np.float64(self.scaler.scale_[0]),
+        }
+        layers = []
+        for layer in self.model.layers:
+            kind = type(layer).__name__
+            if kind == 'Dropout':
+                continue  # Tidak aktif saat inferensi
+            weights = layer.get_weights()
+            spec = {'type': kind, 'weights': len(weights)}
+            if kind == 'LSTM':
+                spec.update(activation=layer.activation.__name__,
+                            recurrent_activation=layer.recurrent_activation.__name__,
+                            return_sequences=layer.return_sequences)
+            elif kind == 'BatchNormalization':
+                spec['epsilon'] = float(layer.epsilon)
+            elif kind == 'Dense':
+                spec['activation'] = layer.activation.__name__
+            else:
+                raise ValueError(f"Layer {kind} belum didukung untuk export")
+            for j, weight in enumerate(weights):
+                arrays[f'layer{len(layers)}_{j}'] = weight
+            layers.append(spec)
+
+        arrays['spec'] = np.array(json.dumps({'seq_length': self.seq_length, 'layers': layers}))
+        np.savez(path, **arrays)
+        return path
+
     def predict_next(self, df):
         last_sequence = df['angka'].values[-self.seq_length:].reshape(-1, 1)
         last_sequence_scaled = self.scaler.transform(last_sequence)
         last_sequence_reshaped = last_sequence_scaled.reshape((1, self.seq_length, 1))
         
         prediction_scaled = self.model.predict(last_sequence_reshaped)
-        prediction = self.scaler.inverse_transform(prediction_scaled)
+        # Kembalikan ke skala asli per langkah (horizon bisa lebih dari 1)
+        prediction = self.scaler.inverse_transform(prediction_scaled.reshape(-1, 1))
         
         return prediction[0][0]
 
     def generate_combinations(self, prediction):
+        """
+        Kombinasi 2 sampai 4 digit dari angka prediksi, tanpa duplikat dan terurut.
+        """
         pred_str = str(int(prediction))
         combinations = {}
         
         for length in range(2, min(5, len(pred_str) + 1)):
-            perms = set([''.join(p) for p in permutations(pred_str, length)])
-            combinations[length] = sorted(perms)
+            combinations[length] = list(unique_permutations(pred_str, length))
             
         return combinations
 
@@ -113,30 +432,109 @@ class NumberPredictor:
             print(f"{length}-digit: {', '.join(combs)}")
 
     def save_pdf_report(self, prediction, combinations, filename=None):
-        if not filename:
-            filename = f'Prediksi_{int(time.time())}.pdf'
-            
-        c = canvas.Canvas(filename, pagesize=letter)
-        width, height = letter
-        
-        # Header
-        c.setFont("Helvetica-Bold", 20)
-        c.drawString(50, height - 50, "Laporan Prediksi Angka")
-        
-        # Prediction
-        c.setFont("Helvetica", 12)
-        c.drawString(50, height - 100, f"Prediksi: {prediction:.0f}")
-        
-        # Combinations
-        y_pos = height - 130
-        for length, combs in combinations.items():
-            c.drawString(50, y_pos, f"{length}-digit: {', '.join(combs)}")
-            y_pos -= 20
-            
-        c.save()
-        return filename
+        return save_multi_report({None: {'prediction': prediction, 'combinations': combinations}}, filename)
+
+def unique_permutations(digits, length):
+    """
+    Yield permutasi unik sepanjang `length` dari multiset digit secara leksikografis,
+    langsung dari jumlah tiap digit sehingga tidak ada duplikat yang dibuat lalu dibuang.
+    """
+    counts = Counter(digits)
+    keys = sorted(counts)
+    prefix = []
+
+    def walk(depth):
+        if depth == length:
+            yield ''.join(prefix)
+            return
+        for digit in keys:
+            if counts[digit]:
+                counts[digit] -= 1
+                prefix.append(digit)
+                yield from walk(depth + 1)
+                prefix.pop()
+                counts[digit] += 1
+
+    return walk(0)
+
+class ReportWriter:
+    """
+    Penulis PDF sederhana dengan pemotongan baris dan pindah halaman otomatis.
+    """
+
+    def __init__(self, filename, pagesize=letter, margin=50, font="Helvetica", font_size=12, leading=16):
+        self.canvas = canvas.Canvas(filename, pagesize=pagesize)
+        self.width, self.height = pagesize
+        self.margin = margin
+        self.font = font
+        self.font_size = font_size
+        self.leading = leading
+        self.y = self.height - margin
+
+    def _ensure_space(self, height):
+        if self.y - height < self.margin:
+            self.canvas.showPage()
+            self.y = self.height - self.margin
+
+    def heading(self, text, font_size=20):
+        self._ensure_space(font_size + self.leading)
+        self.canvas.setFont(f"{self.font}-Bold", font_size)
+        self.canvas.drawString(self.margin, self.y, text)
+        self.y -= font_size + self.leading
+
+    def line(self, text=""):
+        self._ensure_space(self.leading)
+        self.canvas.setFont(self.font, self.font_size)
+        self.canvas.drawString(self.margin, self.y, text)
+        self.y -= self.leading
+
+    def wrapped(self, prefix, items, separator=", "):
+        """Tulis item (boleh generator) berurutan, dipotong per baris sesuai lebar halaman."""
+        max_width = self.width - 2 * self.margin
+        current = prefix
+        first = True
+        for item in items:
+            piece = item if first else separator + item
+            if self.canvas.stringWidth(current + piece, self.font, self.font_size) > max_width and not first:
+                self.line(current + separator.rstrip())
+                current, piece = "    ", item
+            current += piece
+            first = False
+        self.line(current)
+
+    def save(self):
+        self.canvas.save()
+
+def save_multi_report(results, filename=None):
+    """
+    Tulis laporan PDF untuk satu atau banyak sumber sekaligus.
+
+    Parameters:
+    results (dict): {nama_sumber: {'prediction': angka, 'combinations': {panjang: iterable}}};
+                    nama None untuk laporan satu sumber tanpa judul bagian.
+    """
+    if not filename:
+        filename = f'Prediksi_{int(time.time())}.pdf'
+
+    writer = ReportWriter(filename)
+    writer.heading("Laporan Prediksi Angka")
+    for name, result in results.items():
+        if name is not None:
+            writer.heading(str(name), font_size=14)
+        writer.line(f"Prediksi: {result['prediction']:.0f}")
+        for length, combs in result['combinations'].items():
+            writer.wrapped(f"{length}-digit: ", combs)
+        writer.line()
+
+    writer.save()
+    return filename
 
 def main():
+    # Contoh: configure_threads(32, 2) di mesin 32 core
+    configure_threads(
+        int(os.environ['TF_INTRA_OP_THREADS']) if 'TF_INTRA_OP_THREADS' in os.environ else None,
+        int(os.environ['TF_INTER_OP_THREADS']) if 'TF_INTER_OP_THREADS' in os.environ else None,
+    )
     predictor = NumberPredictor("https://rankcrack.com/data-hongkong.php")
     
     try:
@@ -144,10 +542,13 @@ def main():
         
         # Load and process data
         df = predictor.fetch_data()
-        X, y = predictor.preprocess_data(df)
         
+        # Latih model, atau pakai cache jika data belum berubah
         print("Training model...")
-        predictor.train_model(X, y)
+        predictor.train_or_load(df, pipeline=True)
+        
+        # Export untuk prediksi cepat tanpa TensorFlow (predicts/infer.py)
+        predictor.export_numpy()
         
         # Make prediction
         prediction = predictor.predict_next(df)
@@ -0,0 +1,143 @@
+import argparse
+import json
+import sys
+
+import numpy as np
+
+# Modul ini sengaja tidak meng-import TensorFlow/Keras: bobot hasil
+# NumberPredictor.export_numpy() dijalankan ulang dengan NumPy murni.
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'tanh': np.tanh,
+    'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x)),
+}
+
+
+class NumpyLSTMModel:
+    """
+    Forward pass LSTM/BatchNormalization/Dense setara Keras untuk inferensi di CPU.
+
+    Beberapa model dengan arsitektur sama bisa digabung lewat stack(); bobotnya
+    ditumpuk pada sumbu pertama sehingga semua sumber dihitung dalam satu pass.
+    """
+
+    def __init__(self, layers, scaler_min, scaler_scale, seq_length, stacked=False):
+        self.layers = layers
+        self.scaler_min = scaler_min
+        self.scaler_scale = scaler_scale
+        self.seq_length = seq_length
+        self.stacked = stacked
+
+    @classmethod
+    def load(cls, path='model_numpy.npz'):
+        data = np.load(path)
+        spec = json.loads(str(data['spec']))
+        layers = []
+        for i, layer in enumerate(spec['layers']):
+            weights = [data[f'layer{i}_{j}'] for j in range(layer['weights'])]
+            layers.append((layer, weights))
+        return cls(layers, float(data['scaler_min']), float(data['scaler_scale']), spec['seq_length'])
+
+    @classmethod
+    def stack(cls, models):
+        """
+        Gabungkan beberapa model berarsitektur sama menjadi satu model bertumpuk.
+        """
+        first = models[0]
+        for model in models[1:]:
+            same = (model.seq_length == first.seq_length and len(model.layers) == len(first.layers)
+                    and all(a == b and all(x.shape == y.shape for x, y in zip(wa, wb))
+                            for (a, wa), (b, wb) in zip(model.layers, first.layers)))
+            if not same:
+                raise ValueError("Arsitektur model berbeda, tidak bisa digabung")
+        layers = [
+            (spec, [np.stack([model.layers[i][1][j] for model in models]) for j in range(len(weights))])
+            for i, (spec, weights) in enumerate(first.layers)
+        ]
+        return cls(layers,
+                   np.array([model.scaler_min for model in models]),
+                   np.array([model.scaler_scale for model in models]),
+                   first.seq_length, stacked=True)
+
+    def _align(self, weight, ndim):
+        # Model bertumpuk: (S, ...) -> (S, 1, ..., ...) agar broadcast ke (S, batch, ...)
+        if not self.stacked:
+            return weight
+        return weight.reshape(weight.shape[:1] + (1,) * (ndim - weight.ndim) + weight.shape[1:])
+
+    def _lstm(self, x, layer, weights):
+        kernel, recurrent_kernel, bias = weights
+        act = ACTIVATIONS[layer['activation']]
+        recurrent_act = ACTIVATIONS[layer['recurrent_activation']]
+        units = recurrent_kernel.shape[-2]
+        steps = x.shape[-2]
+        h = np.zeros(x.shape[:-2] + (units,), dtype=x.dtype)
+        c = np.zeros_like(h)
+        # Proyeksi input untuk semua langkah sekaligus
+        projected = x @ self._align(kernel, x.ndim) + self._align(bias, x.ndim)
+        outputs = []
+        for t in range(steps):
+            z = projected[..., t, :] + h @ recurrent_kernel
+            i = recurrent_act(z[..., :units])
+            f = recurrent_act(z[..., units:2 * units])
+            g = act(z[..., 2 * units:3 * units])
+            o = recurrent_act(z[..., 3 * units:])
+            c = f * c + i * g
+            h = o * act(c)
+            outputs.append(h)
+        return np.stack(outputs, axis=-2) if layer['return_sequences'] else h
+
+    def forward(self, x):
+        for layer, weights in self.layers:
+            kind = layer['type']
+            if kind == 'LSTM':
+                x = self._lstm(x, layer, weights)
+            elif kind == 'BatchNormalization':
+                gamma, beta, mean, variance = (self._align(w, x.ndim) for w in weights)
+                x = gamma * (x - mean) / np.sqrt(variance + layer['epsilon']) + beta
+            elif kind == 'Dense':
+                kernel, bias = weights
+                x = ACTIVATIONS[layer['activation']](x @ self._align(kernel, x.ndim) + self._align(bias, x.ndim))
+        return x
+
+    def predict(self, sequences):
+        """
+        Prediksi angka berikutnya untuk satu atau banyak urutan (batch).
+
+        Parameters:
+        sequences (array-like): bentuk (seq_length,) atau (batch, seq_length), nilai asli.
+            Untuk model bertumpuk: (sumber, batch, seq_length).
+
+        Returns:
+        np.ndarray: prediksi langkah pertama per urutan, skala asli.
+        """
+        x = np.asarray(sequences, dtype=np.float32)
+        if x.ndim == 1 or (self.stacked and x.ndim == 2):
+            x = x[..., np.newaxis, :]
+        x = x[..., -self.seq_length:]
+        # Parameter scaler per sumber: (S,) -> (S, 1, 1) untuk input, (S, 1) untuk output
+        shape = (-1,) + (1,) * (x.ndim - 1) if self.stacked else ()
+        scaler_min = np.reshape(self.scaler_min, shape)
+        scaler_scale = np.reshape(self.scaler_scale, shape)
+        scaled = (x * scaler_scale + scaler_min)[..., np.newaxis].astype(np.float32)
+        output = self.forward(scaled)[..., 0]
+        out_shape = shape[:-1]
+        return (output - np.reshape(scaler_min, out_shape)) / np.reshape(scaler_scale, out_shape)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prediksi cepat tanpa TensorFlow.")
+    parser.add_argument('--model', default='model_numpy.npz', help="File hasil export_numpy()")
+    parser.add_argument('values', nargs='*', type=float,
+                        help="Angka terakhir; tanpa argumen, baca satu urutan per baris dari stdin")
+    args = parser.parse_args()
+
+    model = NumpyLSTMModel.load(args.model)
+    if args.values:
+        batch = [args.values]
+    else:
+        batch = [[float(v) for v in line.split()] for line in sys.stdin if line.strip()]
+    for prediction in model.predict(batch):
+        print(f"{prediction:.0f}")
@@ -0,0 +1,128 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from hk import NumberPredictor, save_multi_report
+from infer import NumpyLSTMModel
+
+DEFAULT_SOURCES = {
+    'hongkong': 'https://rankcrack.com/data-hongkong.php',
+}
+
+
+def load_sources(path=None):
+    """Baca konfigurasi sumber {"nama": "url"} dari file JSON, atau pakai default."""
+    if path:
+        with open(path, 'r') as f:
+            return json.load(f)
+    return dict(DEFAULT_SOURCES)
+
+
+def make_session(pool_size):
+    """Satu session keep-alive dengan pool koneksi yang dipakai semua sumber."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def build_predictors(sources, data_dir='.'):
+    session = make_session(max(1, len(sources)))
+    predictors = {}
+    for name, url in sources.items():
+        predictor = NumberPredictor(
+            url,
+            cache_file=os.path.join(data_dir, f'data_{name}.joblib'),
+            model_dir=os.path.join(data_dir, 'model_cache', name),
+        )
+        predictor.session = session
+        predictors[name] = predictor
+    return predictors
+
+
+def fetch_all(predictors):
+    """Ambil tabel semua sumber secara bersamaan."""
+    with ThreadPoolExecutor(max_workers=max(1, len(predictors))) as executor:
+        futures = {name: executor.submit(predictor.fetch_data) for name, predictor in predictors.items()}
+        frames, errors = {}, {}
+        for name, future in futures.items():
+            try:
+                frames[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+    return frames, errors
+
+
+def predict_all(predictors, frames, data_dir='.'):
+    """
+    Latih/muat satu model per sumber, lalu prediksi semua sumber sekaligus
+    dengan model NumPy bertumpuk (satu forward pass).
+    """
+    models = {}
+    for name, df in frames.items():
+        predictor = predictors[name]
+        status = predictor.train_or_load(df)
+        print(f"[{name}] model {status}")
+        models[name] = NumpyLSTMModel.load(
+            predictor.export_numpy(os.path.join(data_dir, f'model_{name}.npz')))
+
+    names = list(models)
+    if not names:
+        return {}
+    sequences = [frames[name]['angka'].values[-models[name].seq_length:] for name in names]
+    try:
+        stacked = NumpyLSTMModel.stack([models[name] for name in names])
+        predictions = stacked.predict(np.array(sequences, dtype=np.float32)[:, np.newaxis, :])[:, 0]
+    except ValueError:
+        # Arsitektur berbeda: prediksi per model
+        predictions = [models[name].predict(sequence)[0] for name, sequence in zip(names, sequences)]
+    return dict(zip(names, (float(p) for p in predictions)))
+
+
+def run(sources, output='prediksi_multi.json', data_dir='.', pdf=None):
+    start = time.perf_counter()
+    predictors = build_predictors(sources, data_dir)
+    frames, errors = fetch_all(predictors)
+    for name, error in errors.items():
+        print(f"[{name}] gagal mengambil data: {error}")
+
+    predictions = predict_all(predictors, frames, data_dir)
+    results = {}
+    for name, prediction in predictions.items():
+        predictor = predictors[name]
+        results[name] = {
+            'url': predictor.url,
+            'last_values': frames[name]['angka'].tail(predictor.seq_length).tolist(),
+            'prediction': round(prediction),
+            'combinations': predictor.generate_combinations(prediction),
+        }
+        print(f"[{name}] prediksi berikutnya: {prediction:.0f}")
+
+    with open(output, 'w') as f:
+        json.dump({'generated_at': int(time.time()), 'results': results, 'errors': errors,
+                   'seconds': round(time.perf_counter() - start, 3)}, f, indent=4)
+    print(f"\nHasil semua sumber tersimpan di: {output}")
+
+    if pdf is not None and results:
+        pdf_file = save_multi_report(results, pdf or None)
+        print(f"Laporan PDF semua sumber tersimpan di: {pdf_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prediksi banyak sumber data sekaligus.")
+    parser.add_argument('--sources', default=None, help='File JSON {"nama": "url"}')
+    parser.add_argument('--data-dir', default='.', help="Folder cache data dan model")
+    parser.add_argument('-o', '--output', default='prediksi_multi.json')
+    parser.add_argument('--pdf', nargs='?', const='', default=None,
+                        help="Tulis juga satu laporan PDF untuk semua sumber (opsional: nama file)")
+    args = parser.parse_args()
+
+    run(load_sources(args.sources), args.output, args.data_dir, args.pdf)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import hk
+except ImportError:  # TensorFlow tidak terpasang
+    hk = None
+
+
+class _TablePage(BaseHTTPRequestHandler):
+    """Pengganti halaman sumber: tabel myTable berisi `rows` milik server."""
+
+    def do_GET(self):
+        cells = ''.join(f'<tr><td>{row}</td></tr>' for row in self.server.rows)
+        body = f'<html><table id="myTable">{cells}</table></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(hk is None, "TensorFlow tidak terpasang")
+class MergeNewRowsTest(unittest.TestCase):
+    def test_appends_rows_after_anchor(self):
+        self.assertEqual(hk.merge_new_rows([1, 2, 3, 4, 5], [3, 4, 5, 6, 7]), [6, 7])
+        self.assertEqual(hk.merge_new_rows([1, 2, 3], [0, 1, 2, 3, 4]), [4])
+        self.assertEqual(hk.merge_new_rows([1, 2], [1, 2, 3]), [3])
+
+    def test_short_or_missing_overlap_is_rejected(self):
+        self.assertIsNone(hk.merge_new_rows([1, 2, 3], [3, 9]))
+        self.assertIsNone(hk.merge_new_rows([1, 2, 3, 4, 5], [4, 5, 6]))
+        self.assertIsNone(hk.merge_new_rows([1, 2, 3], [1, 2, 4]))
+
+
+@unittest.skipIf(hk is None, "TensorFlow tidak terpasang")
+class FetchDataTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _TablePage)
+        self.server.rows = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp = tempfile.TemporaryDirectory()
+        url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+        self.predictor = hk.NumberPredictor(url, cache_file=os.path.join(self.tmp.name, 'data.joblib'))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.predictor.session.close()
+        self.tmp.cleanup()
+
+    def fetch(self, rows):
+        self.server.rows = rows
+        return self.predictor.fetch_data(force=True)['angka'].tolist()
+
+    def test_new_rows_are_appended(self):
+        self.fetch([1111, 2222, 3333, 4444, 5555, 6666])
+        self.assertEqual(self.fetch([3333, 4444, 5555, 6666, 7777]),
+                         [1111, 2222, 3333, 4444, 5555, 6666, 7777])
+
+    def test_corrected_page_replaces_cache(self):
+        self.fetch([1111, 2222, 3333, 4444, 5555, 6666])
+        self.assertEqual(self.fetch([1111, 2222, 3333, 4444, 5555, 6667]),
+                         [1111, 2222, 3333, 4444, 5555, 6667])
+
+    def test_single_value_overlap_replaces_cache(self):
+        self.fetch([1111, 2222, 3333])
+        self.assertEqual(self.fetch([3333, 9999]), [3333, 9999])
+
+
+if __name__ == '__main__':
+    unittest.main()
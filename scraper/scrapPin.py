@@ -1,15 +1,23 @@
 import os
+import re
+import json
+import argparse
+import time
+import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urlparse
 
-def expand_short_url(short_url):
+# Urutan ukuran gambar yang dipilih dari state JSON (terbesar dulu)
+IMAGE_SIZES = ('orig', '736x', '564x', '474x', '236x')
+
+def expand_short_url(short_url, session=None):
     """Konversi URL pendek pin.it ke URL asli."""
     try:
-        response = requests.get(short_url, allow_redirects=False)
+        response = (session or requests).get(short_url, allow_redirects=False, timeout=15)
         if 300 <= response.status_code < 400:
             return response.headers['Location']
         return short_url
@@ -17,66 +25,428 @@ def expand_short_url(short_url):
         print(f"Gagal mengembangkan URL: {e}")
         return short_url
 
-def download_image(img_url, save_dir, filename):
-    """Unduh gambar dari URL."""
-    os.makedirs(save_dir, exist_ok=True)
+def make_session(pool_size=16):
+    """Session keep-alive bersama dengan pool koneksi sebesar jumlah worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class DownloadManifest:
+    """
+    Manifest lokal (manifest.json di folder simpan) yang memetakan URL ke hash
+    SHA-256 isi file, dan hash ke file yang tersimpan. Gambar yang sudah pernah
+    diunduh dilewati, dan isi yang sama hanya disimpan sekali.
+    """
+
+    def __init__(self, save_dir):
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, 'manifest.json')
+        self.lock = threading.Lock()
+        self.urls, self.hashes = {}, {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.urls, self.hashes = data.get('urls', {}), data.get('hashes', {})
+            except (OSError, ValueError) as e:
+                print(f"Manifest rusak, dibuat ulang: {e}")
+
+    def lookup(self, url):
+        """Path file untuk URL jika sudah diunduh dan file-nya masih ada."""
+        with self.lock:
+            entry = self.urls.get(url)
+        if entry and os.path.exists(os.path.join(self.save_dir, entry['file'])):
+            return os.path.join(self.save_dir, entry['file'])
+        return None
+
+    def add(self, url, part_path, ext):
+        """
+        Daftarkan file hasil unduhan. Jika isinya sudah ada, file sementara
+        dihapus dan path yang lama dipakai; selain itu disimpan sebagai <hash>.<ext>.
+        """
+        digest = file_sha256(part_path)
+        with self.lock:
+            existing = self.hashes.get(digest)
+            if existing and os.path.exists(os.path.join(self.save_dir, existing)):
+                os.remove(part_path)
+                name, duplicate = existing, True
+            else:
+                name, duplicate = f"{digest[:16]}.{ext}", False
+                os.replace(part_path, os.path.join(self.save_dir, name))
+                self.hashes[digest] = name
+            self.urls[url] = {'sha256': digest, 'file': name}
+            self._save()
+        return os.path.join(self.save_dir, name), duplicate
+
+    def _save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'urls': self.urls, 'hashes': self.hashes}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _image_ext(img_url):
+    ext = img_url.split('.')[-1].split('?')[0]
+    return ext if ext.lower() in ['jpg', 'jpeg', 'png', 'webp'] else 'jpg'
+
+def _parse_content_range(value):
+    """'bytes 100-199/500' -> (100, 500); 'bytes */500' -> (None, 500). Total '*' -> None."""
+    match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', value or '')
+    if not match:
+        return None, None
+    first, total = match.groups()
+    return (int(first) if first else None), (int(total) if total != '*' else None)
+
+def _load_part_validator(part_path):
+    """ETag/Last-Modified yang dicatat saat file .part mulai ditulis."""
     try:
-        response = requests.get(img_url, stream=True)
-        if response.status_code == 200:
-            ext = img_url.split('.')[-1].split('?')[0]
-            ext = ext if ext.lower() in ['jpg', 'jpeg', 'png', 'webp'] else 'jpg'
-            filepath = os.path.join(save_dir, f"{filename}.{ext}")
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        with open(part_path + '.json', 'r', encoding='utf-8') as f:
+            return json.load(f).get('validator')
+    except (OSError, ValueError):
+        return None
+
+def _discard_part(part_path):
+    for path in (part_path, part_path + '.json'):
+        if os.path.exists(path):
+            os.remove(path)
+
+def download_image(img_url, save_dir, filename, session=None, retries=3, backoff=0.5, timeout=30, manifest=None):
+    """
+    Unduh gambar dari URL, ulangi dengan backoff eksponensial jika gagal.
+    Unduhan ditulis ke file .part dulu; jika terputus, percobaan berikutnya
+    (juga di run berikutnya) melanjutkan dengan header Range + If-Range, memakai
+    ETag/Last-Modified yang disimpan di <part>.json. Jika gambar berubah atau
+    server mengirim range lain, unduhan diulang dari awal.
+    Dengan `manifest`, file disimpan berdasarkan hash isinya dan `filename` diabaikan.
+
+    Returns:
+        (filepath, jumlah byte yang diunduh), atau (None, 0) jika gagal.
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    if manifest is not None:
+        existing = manifest.lookup(img_url)
+        if existing:
+            return existing, 0
+        url_key = hashlib.sha1(img_url.encode('utf-8')).hexdigest()
+        part_path = os.path.join(save_dir, f".{url_key}.part")
+    else:
+        part_path = os.path.join(save_dir, f"{filename}.{_image_ext(img_url)}.part")
+
+    http = session or requests
+    size = 0
+    for attempt in range(retries + 1):
+        complete = False
+        try:
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            validator = _load_part_validator(part_path) if offset else None
+            if offset and not validator:
+                # Tanpa validator tidak bisa dipastikan isinya masih sama
+                _discard_part(part_path)
+                offset = 0
+            headers = {'Range': f"bytes={offset}-", 'If-Range': validator} if offset else {}
+            response = http.get(img_url, stream=True, timeout=timeout, headers=headers)
+            if response.status_code == 416:
+                response.close()
+                _, total = _parse_content_range(response.headers.get('Content-Range'))
+                if total is not None and total == offset:
+                    complete = True  # File .part sudah lengkap
+                else:
+                    _discard_part(part_path)
+                    error = "HTTP 416"
+                    continue
+            elif response.status_code == 206:
+                first, expected = _parse_content_range(response.headers.get('Content-Range'))
+                if first != offset:
+                    response.close()
+                    _discard_part(part_path)
+                    error = "Content-Range tidak sesuai, mulai dari awal"
+                    continue
+                with open(part_path, 'ab') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        size += len(chunk)
+            elif response.status_code == 200:
+                # 200 berarti server mengabaikan Range atau gambar berubah, tulis dari awal
+                new_validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                if new_validator:
+                    with open(part_path + '.json', 'w', encoding='utf-8') as f:
+                        json.dump({'url': img_url, 'validator': new_validator}, f)
+                elif os.path.exists(part_path + '.json'):
+                    os.remove(part_path + '.json')
+                content_length = response.headers.get('Content-Length')
+                expected = int(content_length) if content_length and content_length.isdigit() else None
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        size += len(chunk)
+            else:
+                response.close()
+                # 4xx selain 429 tidak akan berubah jika diulang
+                if response.status_code < 500 and response.status_code != 429:
+                    print(f"Gagal mengunduh {img_url}: HTTP {response.status_code}")
+                    return None, 0
+                raise IOError(f"HTTP {response.status_code}")
+
+            if not complete and expected is not None and os.path.getsize(part_path) != expected:
+                raise IOError(f"Unduhan terputus ({os.path.getsize(part_path)}/{expected} byte)")
+
+            if os.path.exists(part_path + '.json'):
+                os.remove(part_path + '.json')
+            if manifest is not None:
+                filepath, duplicate = manifest.add(img_url, part_path, _image_ext(img_url))
+                if duplicate:
+                    print(f"Duplikat, memakai file yang ada: {filepath}")
+                    return filepath, size
+            else:
+                filepath = part_path[:-len('.part')]
+                os.replace(part_path, filepath)
             print(f"Unduh berhasil: {filepath}")
-    except Exception as e:
-        print(f"Gagal mengunduh {img_url}: {e}")
+            return filepath, size
+        except Exception as e:
+            error = e
+        if attempt < retries:
+            time.sleep(backoff * (2 ** attempt))
+    print(f"Gagal mengunduh {img_url}: {error}")
+    return None, size
 
-def scrape_pinterest(url, save_dir="pinterest_images"):
-    """Scraping gambar dari URL Pinterest."""
-    # Konversi URL pendek ke URL asli
-    expanded_url = expand_short_url(url)
-    print(f"URL asli: {expanded_url}")
+def download_images(jobs, save_dir, workers=8, per_host=4, retries=3, backoff=0.5, session=None, dedupe=True):
+    """
+    Unduh banyak gambar sekaligus dengan thread pool yang berbagi satu session.
+    Dengan dedupe=True, URL yang sudah tercatat di manifest dilewati dan isi
+    yang sama hanya disimpan sekali.
+
+    Parameters:
+        jobs (list): Daftar (img_url, filename).
+        workers (int): Jumlah unduhan paralel total.
+        per_host (int): Batas unduhan paralel ke host yang sama.
+
+    Returns:
+        dict: Ringkasan (downloaded, skipped, failed, bytes, seconds, files).
+    """
+    session = session or make_session(workers)
+    manifest = DownloadManifest(save_dir) if dedupe else None
+    host_limits = {}
+    lock = threading.Lock()
+
+    def host_limit(url):
+        host = urlparse(url).netloc
+        with lock:
+            if host not in host_limits:
+                host_limits[host] = threading.Semaphore(per_host)
+            return host_limits[host]
+
+    def fetch(img_url, filename):
+        with host_limit(img_url):
+            return download_image(img_url, save_dir, filename, session=session,
+                                  retries=retries, backoff=backoff, manifest=manifest)
+
+    skipped = 0
+    if manifest is not None:
+        # URL yang sama cukup diunduh sekali, yang sudah ada di manifest dilewati
+        pending, seen = [], set()
+        for img_url, filename in jobs:
+            if img_url in seen:
+                continue
+            seen.add(img_url)
+            if manifest.lookup(img_url):
+                skipped += 1
+            else:
+                pending.append((img_url, filename))
+        jobs = pending
+        if skipped:
+            print(f"{skipped} gambar sudah ada di manifest, dilewati.")
+
+    start = time.perf_counter()
+    files, failed, total_bytes = [], 0, 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fetch, img_url, filename) for img_url, filename in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            filepath, size = future.result()
+            total_bytes += size
+            if filepath:
+                files.append(filepath)
+            else:
+                failed += 1
+            elapsed = time.perf_counter() - start
+            print(f"[{done}/{len(jobs)}] {total_bytes / 1024 / max(elapsed, 1e-9):.1f} KB/s")
+
+    elapsed = time.perf_counter() - start
+    print(f"Selesai: {len(files)} berhasil, {skipped} dilewati, {failed} gagal, "
+          f"{total_bytes / 1024:.1f} KB dalam {elapsed:.2f} detik")
+    return {'downloaded': len(files), 'skipped': skipped, 'failed': failed, 'bytes': total_bytes,
+            'seconds': elapsed, 'files': files}
+
+def _collect_images(node, urls):
+    """Telusuri state JSON dan ambil URL resolusi terbesar dari setiap objek `images`."""
+    if isinstance(node, dict):
+        images = node.get('images')
+        if isinstance(images, dict):
+            for size in IMAGE_SIZES:
+                image = images.get(size)
+                if isinstance(image, dict) and image.get('url'):
+                    urls.append(image['url'])
+                    break
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                _collect_images(value, urls)
+    elif isinstance(node, list):
+        for value in node:
+            if isinstance(value, (dict, list)):
+                _collect_images(value, urls)
+
+def extract_pin_urls_from_json(html):
+    """
+    Ambil URL gambar pin dari state JSON yang disematkan di halaman
+    (mis. <script id="__PWS_DATA__">), tanpa perlu browser.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    urls = []
+    for script in soup.find_all('script', {'type': 'application/json'}):
+        try:
+            _collect_images(json.loads(script.string or ''), urls)
+        except ValueError:
+            continue
+    return list(dict.fromkeys(urls))
+
+def extract_pin_urls_from_html(html):
+    """Ambil URL gambar dari tag <img> hasil render browser."""
+    soup = BeautifulSoup(html, 'html.parser')
+    # Cari semua tag gambar (sesuaikan selector sesuai struktur Pinterest)
+    img_elements = soup.find_all('img', {'data-testid': 'pin-image'})  # Selector mungkin berubah!
+    urls = []
+    for img in img_elements:
+        img_url = img.get('src') or (img.get('srcset', '').split() or [None])[0]
+        if img_url and '236x' not in img_url:  # Hindari thumbnail kecil
+            urls.append(img_url.replace('236x', '564x'))  # Coba dapatkan resolusi lebih tinggi
+    return list(dict.fromkeys(urls))
+
+def launch_browser():
+    """Jalankan satu Chrome headless. Selenium hanya diimpor jika browser benar-benar dibutuhkan."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
 
-    # Setup Selenium untuk browser Chrome # Setup Selenium untuk browser Chrome
     options = webdriver.ChromeOptions()
     options.add_argument('--headless')  # Jalankan di latar belakang
     options.add_argument('--disable-gpu')
     options.add_argument('--no-sandbox')
-    # Specify the path to the chromedriver executable
     service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options) 
+    return webdriver.Chrome(service=service, options=options)
+
+def render_board(driver, url, timeout=15, max_scrolls=10, scroll_timeout=3):
+    """
+    Buka board di browser dan scroll sampai jumlah pin berhenti bertambah.
+    Menunggu kondisi eksplisit (dokumen selesai dimuat dan pin bertambah),
+    bukan jeda tetap.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
 
+    selector = 'img[data-testid="pin-image"]'
+    driver.get(url)
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == 'complete')
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, selector))
+    except TimeoutException:
+        return driver.page_source
 
+    for _ in range(max_scrolls):
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, scroll_timeout).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, selector)) > count)
+        except TimeoutException:
+            break  # Tidak ada pin baru, board sudah habis
+    return driver.page_source
 
+def scrape_boards(urls, save_dir="pinterest_images", workers=8, per_host=4, browser='auto'):
+    """
+    Scraping banyak board sekaligus dengan satu session HTTP dan paling banyak
+    satu browser untuk semua board.
 
+    Parameters:
+        urls (list): Daftar URL board/pin (boleh URL pendek pin.it).
+        browser (str): 'auto' = browser hanya jika state JSON kosong,
+            'never' = tanpa browser, 'always' = selalu render dengan browser.
+
+    Returns:
+        dict: Ringkasan per URL (source, pins, downloaded, skipped, failed, seconds).
+    """
+    session = make_session(workers)
+    driver = None
+    summary = {}
     try:
-        driver.get(expanded_url)
-        driver.implicitly_wait(10)  # Tunggu hingga konten dimuat
+        for url in urls:
+            start = time.perf_counter()
+            # Konversi URL pendek ke URL asli
+            expanded_url = expand_short_url(url, session)
+            print(f"URL asli: {expanded_url}")
 
-        # Scroll halaman untuk memuat gambar (ulangi sesuai kebutuhan)
-        for _ in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            driver.implicitly_wait(2)
+            pin_urls, source = [], 'json'
+            if browser != 'always':
+                try:
+                    response = session.get(expanded_url, timeout=30)
+                    response.raise_for_status()
+                    pin_urls = extract_pin_urls_from_json(response.text)
+                except Exception as e:
+                    print(f"Gagal mengambil halaman {expanded_url}: {e}")
+            if not pin_urls and browser != 'never':
+                source = 'browser'
+                try:
+                    if driver is None:
+                        driver = launch_browser()
+                    pin_urls = extract_pin_urls_from_html(render_board(driver, expanded_url))
+                except Exception as e:
+                    print(f"Terjadi kesalahan: {e}")
 
-        # Parse HTML dengan BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+            print(f"{len(pin_urls)} gambar ditemukan ({source})")
+            jobs = [(pin_url, f"pin_{idx+1}") for idx, pin_url in enumerate(pin_urls)]
+            result = download_images(jobs, save_dir, workers=workers, per_host=per_host, session=session)
+            summary[url] = {'source': source, 'pins': len(pin_urls),
+                            'downloaded': result['downloaded'], 'skipped': result['skipped'],
+                            'failed': result['failed'], 'seconds': time.perf_counter() - start}
+    finally:
+        if driver is not None:
+            driver.quit()
+    return summary
 
-        # Cari semua tag gambar (sesuaikan selector sesuai struktur Pinterest)
-        img_elements = soup.find_all('img', {'data-testid': 'pin-image'})  # Selector mungkin berubah!
+def scrape_pinterest(url, save_dir="pinterest_images", workers=8, per_host=4, browser='auto'):
+    """Scraping gambar dari URL Pinterest."""
+    return scrape_boards([url], save_dir, workers=workers, per_host=per_host, browser=browser)[url]
 
-        for idx, img in enumerate(img_elements):
-            img_url = img.get('src') or img.get('srcset', '').split()[0]
-            if img_url and '236x' not in img_url:  # Hindari thumbnail kecil
-                high_res_url = img_url.replace('236x', '564x')  # Coba dapatkan resolusi lebih tinggi
-                download_image(high_res_url, save_dir, f"pin_{idx+1}")
+def main():
+    parser = argparse.ArgumentParser(description="Unduh gambar dari board Pinterest.")
+    parser.add_argument('urls', nargs='*', help="URL board/pin Pinterest")
+    parser.add_argument('-f', '--file', help="File berisi daftar URL (satu per baris)")
+    parser.add_argument('-o', '--output', default="pinterest_downloads", help="Folder simpan")
+    parser.add_argument('-w', '--workers', type=int, default=8, help="Jumlah unduhan paralel")
+    parser.add_argument('--browser', choices=['auto', 'never', 'always'], default='auto',
+                        help="Kapan memakai Chrome headless")
+    args = parser.parse_args()
 
-    except Exception as e:
-        print(f"Terjadi kesalahan: {e}")
-    finally:
-        driver.quit()
+    urls = list(args.urls)
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    if not urls:
+        urls = ["https://pin.it/36ZKaiJQz"]  # Ganti dengan URL target
+
+    summary = scrape_boards(urls, save_dir=args.output, workers=args.workers, browser=args.browser)
+    for url, info in summary.items():
+        print(f"{url}: {info['pins']} pin via {info['source']}, {info['downloaded']} diunduh, "
+              f"{info['skipped']} dilewati, {info['failed']} gagal ({info['seconds']:.2f} detik)")
 
 if __name__ == '__main__':
-    url = "https://pin.it/36ZKaiJQz"  # Ganti dengan URL target
-    scrape_pinterest(url, save_dir="pinterest_downloads")
\ No newline at end of file
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT_CLI = os.path.join(os.path.dirname(HERE), "cliWrapper.py")
+
+# What the old module paid at import time before any output was produced
+EAGER_IMPORTS = ("import rich.console, rich.table, rich.layout, rich.panel, rich.text, pyfiglet; "
+                 "pyfiglet.figlet_format('2024', font='big')")
+
+CASES = {
+    "lazy import cliWrapper": ["-c", "import cliWrapper"],
+    "eager rich + pyfiglet (old import cost)": ["-c", "import cliWrapper; " + EAGER_IMPORTS],
+    "cliWrapper.py --plain": ["cliWrapper.py", "--plain"],
+    "cliWrapper.py --json": ["cliWrapper.py", "--json"],
+    "root cliWrapper.py --plain": [ROOT_CLI, "--plain"],
+    "root cliWrapper.py --json": [ROOT_CLI, "--json"],
+    "root --json --max-invocations 1000": [ROOT_CLI, "--json", "--max-invocations", "1000"],
+}
+
+def time_case(args, runs):
+    """Run a fresh interpreter `runs` times and return wall times in milliseconds (None on failure)."""
+    samples = []
+    # The root CLI writes cli_command_summary.txt into its working directory
+    cwd = tempfile.gettempdir() if ROOT_CLI in args else HERE
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, *args], cwd=cwd, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, check=False)
+        if result.returncode != 0:
+            return None
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for CLI Wrapped.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", default="startup_bench.json")
+    args = parser.parse_args()
+
+    results = {}
+    for name, case in CASES.items():
+        samples = time_case(case, args.runs)
+        if samples is None:
+            results[name] = {"error": "command failed (missing dependency?)"}
+            print(f"{name:<42} failed")
+            continue
+        results[name] = {
+            "median_ms": round(statistics.median(samples), 1),
+            "min_ms": round(min(samples), 1),
+            "max_ms": round(max(samples), 1),
+        }
+        print(f"{name:<42} median {results[name]['median_ms']:8.1f} ms")
+
+    with open(args.output, "w") as f:
+        json.dump({"python": sys.version.split()[0], "runs": args.runs, "results": results}, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,47 @@
+import argparse
+import hashlib
+import json
 import os
 import re
+import sys
 from collections import Counter
+from datetime import datetime, timedelta
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.text import Text
-import pyfiglet
 
-console = Console()
+# rich and pyfiglet are imported lazily so --plain/--json runs start fast
+BANNER_CACHE_DIR = os.path.expanduser("~/.cache/cli_wrapped/banners")
+
+class _LazyConsole:
+    """Create the rich Console on first use."""
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+console = _LazyConsole()
+
+def render_banner(text, font="small"):
+    """Return figlet ASCII art for text, cached on disk to skip pyfiglet font loading."""
+    key = hashlib.sha1(f"{font}:{text}".encode()).hexdigest()[:16]
+    cache_file = os.path.join(BANNER_CACHE_DIR, f"{key}.txt")
+    try:
+        with open(cache_file, 'r') as f:
+            return f.read()
+    except OSError:
+        pass
+
+    import pyfiglet
+    art = pyfiglet.figlet_format(text, font=font)
+    try:
+        os.makedirs(BANNER_CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            f.write(art)
+    except OSError:
+        pass
+    return art
 
 def parse_history(file_path):
     """Parse terminal history file and return a list of commands and full invocations."""
@@ -43,6 +75,73 @@ def parse_history(file_path):
 
     return commands, full_invocations
 
+HISTORY_ENTRY = re.compile(rb"^[ \t]*: (\d+):\d+;([^;\n]*)", re.MULTILINE)
+
+def _history_identity(file_path, offset):
+    """Identify the history file by device/inode plus a hash of its first bytes."""
+    stat = os.stat(file_path)
+    with open(file_path, 'rb') as file:
+        head = hashlib.sha1(file.read(min(offset, 4096))).hexdigest()
+    return {"dev": stat.st_dev, "ino": stat.st_ino, "head": head}
+
+def load_history_counts(file_path, cache_file=None):
+    """
+    Return per-day (commands, full_invocations) Counters, parsing only the bytes
+    appended since the checkpoint stored in cache_file.
+    """
+    if cache_file is None:
+        key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+        cache_file = os.path.join(os.path.expanduser("~/.cache/cli_wrapped"), f"{key}.json")
+
+    days = {}
+    offset = 0
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        if (cache["offset"] <= os.path.getsize(file_path)
+                and cache["identity"] == _history_identity(file_path, cache["offset"])):
+            offset = cache["offset"]
+            days = {day: (Counter(counts["commands"]), Counter(counts["invocations"]))
+                    for day, counts in cache["days"].items()}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(file_path, 'rb') as file:
+        file.seek(offset)
+        data = file.read()
+    # Only consume complete lines; a partially written last line is picked up next run
+    data = data[:data.rfind(b"\n") + 1]
+    if not data:
+        return days
+
+    day_start = day_end = None
+    for match in HISTORY_ENTRY.finditer(data):
+        timestamp = int(match.group(1))
+        if day_start is None or not (day_start <= timestamp < day_end):
+            midnight = datetime.fromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+            day_start = midnight.timestamp()
+            day_end = (midnight + timedelta(days=1)).timestamp()
+            commands, full_invocations = days.setdefault(midnight.date().isoformat(), (Counter(), Counter()))
+
+        command = match.group(2).decode('utf-8', errors='replace').strip()
+        full_invocations[command] += 1
+        commands[command.split(" ", 1)[0]] += 1
+
+    offset += len(data)
+    if os.path.dirname(cache_file):
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump({
+            "path": os.path.abspath(file_path),
+            "offset": offset,
+            "identity": _history_identity(file_path, offset),
+            "days": {day: {"commands": commands, "invocations": full_invocations}
+                     for day, (commands, full_invocations) in days.items()},
+        }, f)
+    os.replace(tmp_file, cache_file)
+    return days
+
 def analyze_commands(commands, top_n=5):
     """Analyze base command frequency and sort by usage."""
     counter = Counter(commands)
@@ -55,8 +154,13 @@ def analyze_invocations(full_invocations, top_n=5):
 
 def display_cli_wrapped(commands, invocations, total_commands, font_size="small"):
     """Display the CLI Wrapped output with rich styling and layout."""
+    from rich.layout import Layout
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Generate ASCII art for the year
-    ascii_art = pyfiglet.figlet_format("2024", font=font_size)
+    ascii_art = render_banner("2024", font=font_size)
     console.print(Panel(
         Text(ascii_art, style="bold yellow"),
         title="CLI Wrapped",
@@ -102,29 +206,65 @@ def display_cli_wrapped(commands, invocations, total_commands, font_size="small"
 
     # Total Commands with styled panel
     commands_ran_text = Text(f"{total_commands:,} Commands", style="bold white")
-    commands_ran_ascii = pyfiglet.figlet_format(str(total_commands), font="big")
+    commands_ran_ascii = render_banner(str(total_commands), font="big")
     console.print(Panel(
         Text(commands_ran_ascii, style="bold yellow"),
         title=commands_ran_text,
         border_style="bold green"
     ))
+
+def display_plain(commands, invocations, total_commands):
+    """Print the summary as plain text without loading any rendering modules."""
+    print(f"Total Commands Used: {total_commands}\n")
+    print("Top Commands:")
+    for i, (cmd, count) in enumerate(commands, 1):
+        print(f"{i}. {cmd} - {count} times")
+    print("\nTop Invocations:")
+    for i, (inv, count) in enumerate(invocations, 1):
+        print(f"{i}. {inv} - {count} times")
+
 def main():
+    parser = argparse.ArgumentParser(description="CLI Wrapped for your shell history.")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--plain", action="store_true", help="Plain text output (fast start, no rich/pyfiglet)")
+    output.add_argument("--json", action="store_true", help="JSON output (fast start, no rich/pyfiglet)")
+    args = parser.parse_args()
+    fast = args.plain or args.json
+
     history_file = os.path.expanduser("~/.zsh_history")
 
     if not Path(history_file).exists():
-        console.print(f"[bold red]Error:[/bold red] History file '{history_file}' not found!")
+        if fast:
+            print(f"Error: History file '{history_file}' not found!", file=sys.stderr)
+        else:
+            console.print(f"[bold red]Error:[/bold red] History file '{history_file}' not found!")
         return
 
-    commands, full_invocations = parse_history(history_file)
+    commands, full_invocations = Counter(), Counter()
+    for day_commands, day_invocations in load_history_counts(history_file).values():
+        commands.update(day_commands)
+        full_invocations.update(day_invocations)
     if not commands:
-        console.print("[bold red]No commands found.[/bold red]")
+        if fast:
+            print("No commands found.", file=sys.stderr)
+        else:
+            console.print("[bold red]No commands found.[/bold red]")
         return
 
     top_commands = analyze_commands(commands)
     top_invocations = analyze_invocations(full_invocations)
-    total_commands = len(commands)
+    total_commands = sum(commands.values())
 
-    display_cli_wrapped(top_commands, top_invocations, total_commands, font_size="big")
+    if args.json:
+        print(json.dumps({
+            "total_commands": total_commands,
+            "top_commands": top_commands,
+            "top_invocations": top_invocations,
+        }, indent=2))
+    elif args.plain:
+        display_plain(top_commands, top_invocations, total_commands)
+    else:
+        display_cli_wrapped(top_commands, top_invocations, total_commands, font_size="big")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()